@@ -11,22 +11,44 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import asyncio
+import functools
+import hmac
+import logging
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
 import uvicorn
 from dotenv import load_dotenv
+import numpy as np
+import orjson
+
+from backend.responses import ORJSONResponse
+from backend.models import EvaluateRequest, BatchRequest
+from backend.logging_config import start_logging, stop_logging
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:  # optional: pip install numba for the JIT batch kernel
+    _NUMBA_AVAILABLE = False
 
 # Load env vars
 load_dotenv()
 
+logger = logging.getLogger("breakout")
+
+# Admin endpoints are disabled unless ADMIN_TOKEN is set
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+
 # Simple in-memory storage for now (will use Supabase for persistence)
-@dataclass
+# Frozen so memoized instances can be shared safely between requests
+@dataclass(slots=True, frozen=True)
 class EvaluationResult:
     ticker: str
     run_score: int
@@ -40,47 +62,89 @@ class EvaluationResult:
     watch_for: List[str]
     timestamp: str
 
-# Pydantic models
-class EvaluateRequest(BaseModel):
-    ticker: str
+# (epoch second, ISO string) - rebound as one tuple so readers never see a torn pair
+_ts_cache: Tuple[int, str] = (0, "")
 
-class BatchRequest(BaseModel):
-    tickers: List[str]
+def _iso_now() -> str:
+    """Current local time in ISO format, at one-second resolution"""
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _ts_cache[1]
 
-class WebhookRequest(BaseModel):
-    tickers: str
-    source: Optional[str] = "webhook"
+# Verdict tiers indexed by the kernel's tier id: (verdict, upside, fakeout risk)
+_TIERS = (
+    ("High Potential", "50-150%", "Low"),
+    ("Moderate", "20-50%", "Medium"),
+    ("Dud/Fakeout", "<10%", "High"),
+)
+_WATCH_FOR = ["Volume sustainability", "Support level hold", "Sector momentum"]
 
-# Simple evaluation logic (placeholder - will integrate full engine when imports work)
-def simple_evaluate(ticker: str) -> EvaluationResult:
-    """Simple evaluation for testing - full engine integration coming"""
-    import random
-    
-    # Deterministic pseudo-random based on ticker
-    seed = sum(ord(c) for c in ticker.upper())
-    random.seed(seed)
-    
-    inst_score = random.randint(30, 95)
-    narr_score = random.randint(20, 90)
-    other_score = random.randint(40, 85)
-    
-    run_score = round(inst_score * 0.35 + narr_score * 0.35 + other_score * 0.30)
+# SplitMix64 constants; one golden-ratio stream offset per score column
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_GAMMAS = tuple((k * 0x9E3779B97F4A7C15) & _MASK64 for k in (1, 2, 3))
+_INST_GAMMA, _NARR_GAMMA, _OTHER_GAMMA = (np.uint64(g) for g in _GAMMAS)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+def _splitmix64_int(x: int) -> int:
+    """Scalar twin of _splitmix64 - no array allocation for single tickers"""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+def _ticker_seed(ticker: str) -> int:
+    return sum(ord(c) for c in ticker)
+
+def _score_kernel_numpy(seeds: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Score a vector of ticker seeds -> (inst, narr, other, run, tier)"""
+    state = seeds.astype(np.uint64)
+    inst = 30 + (_splitmix64(state + _INST_GAMMA) % np.uint64(66)).astype(np.int64)
+    narr = 20 + (_splitmix64(state + _NARR_GAMMA) % np.uint64(71)).astype(np.int64)
+    other = 40 + (_splitmix64(state + _OTHER_GAMMA) % np.uint64(46)).astype(np.int64)
     
-    if run_score >= 75:
-        verdict = "High Potential"
-        upside = "50-150%"
-        fakeout = "Low"
-    elif run_score >= 50:
-        verdict = "Moderate"
-        upside = "20-50%"
-        fakeout = "Medium"
-    else:
-        verdict = "Dud/Fakeout"
-        upside = "<10%"
-        fakeout = "High"
+    run = np.rint(inst * 0.35 + narr * 0.35 + other * 0.30).astype(np.int64)
+    tier = np.select([run >= 75, run >= 50], [0, 1], default=2)
+    return inst, narr, other, run, tier
+
+if _NUMBA_AVAILABLE:
+    _splitmix64_jit = numba.njit(cache=True)(_splitmix64)
     
+    # nogil rather than parallel=True: numba's default threading layer isn't
+    # safe to enter from concurrent request threads
+    @numba.njit(cache=True, nogil=True)
+    def _score_kernel_jit(seeds):
+        """Fused per-ticker loop; same hash streams as _score_kernel_numpy"""
+        n = seeds.shape[0]
+        inst = np.empty(n, dtype=np.int64)
+        narr = np.empty(n, dtype=np.int64)
+        other = np.empty(n, dtype=np.int64)
+        run = np.empty(n, dtype=np.int64)
+        tier = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            state = np.uint64(seeds[i])
+            inst[i] = 30 + np.int64(_splitmix64_jit(state + _INST_GAMMA) % np.uint64(66))
+            narr[i] = 20 + np.int64(_splitmix64_jit(state + _NARR_GAMMA) % np.uint64(71))
+            other[i] = 40 + np.int64(_splitmix64_jit(state + _OTHER_GAMMA) % np.uint64(46))
+            run[i] = np.int64(np.rint(inst[i] * 0.35 + narr[i] * 0.35 + other[i] * 0.30))
+            tier[i] = 0 if run[i] >= 75 else 1 if run[i] >= 50 else 2
+        return inst, narr, other, run, tier
+
+    _score_kernel = _score_kernel_jit
+else:
+    _score_kernel = _score_kernel_numpy
+
+def _make_result(ticker: str, inst_score: int, narr_score: int, other_score: int,
+                 run_score: int, tier: int, timestamp: str) -> EvaluationResult:
+    verdict, upside, fakeout = _TIERS[tier]
     return EvaluationResult(
-        ticker=ticker.upper(),
+        ticker=ticker,
         run_score=run_score,
         verdict=verdict,
         institutional_score=inst_score,
@@ -89,15 +153,82 @@ def simple_evaluate(ticker: str) -> EvaluationResult:
         reasoning=f"{verdict} — Score breakdown: Institutional {inst_score}, Narrative {narr_score}, Technical {other_score}",
         upside_projection=upside,
         fakeout_risk=fakeout,
-        watch_for=["Volume sustainability", "Support level hold", "Sector momentum"],
-        timestamp=datetime.now().isoformat()
+        watch_for=_WATCH_FOR,
+        timestamp=timestamp
     )
 
+# Simple evaluation logic (placeholder - will integrate full engine when imports work)
+# Scoring is deterministic per ticker, so results are memoized; the timestamp
+# reflects when the ticker was first scored by this process.
+@functools.lru_cache(maxsize=4096)
+def simple_evaluate(ticker: str) -> EvaluationResult:
+    """Simple evaluation for testing - full engine integration coming (ticker already normalized)"""
+    seed = _ticker_seed(ticker)
+    inst_gamma, narr_gamma, other_gamma = _GAMMAS
+    
+    # Same hash streams as _score_kernel, so /evaluate and /batch agree
+    inst = 30 + _splitmix64_int((seed + inst_gamma) & _MASK64) % 66
+    narr = 20 + _splitmix64_int((seed + narr_gamma) & _MASK64) % 71
+    other = 40 + _splitmix64_int((seed + other_gamma) & _MASK64) % 46
+    
+    run = round(inst * 0.35 + narr * 0.35 + other * 0.30)
+    tier = 0 if run >= 75 else 1 if run >= 50 else 2
+    return _make_result(ticker, inst, narr, other, run, tier, _iso_now())
+
+def _batch_seeds(tickers: List[str]) -> np.ndarray:
+    return np.fromiter((_ticker_seed(t) for t in tickers), dtype=np.int64, count=len(tickers))
+
+def _assemble(tickers: List[str], columns: Tuple[np.ndarray, ...]) -> List[EvaluationResult]:
+    rows = [col.tolist() for col in columns]
+    timestamp = _iso_now()
+    return [_make_result(t, *row, timestamp) for t, *row in zip(tickers, *rows)]
+
+def batch_score(tickers: List[str]) -> List[EvaluationResult]:
+    """Score a whole batch in one vectorized pass (tickers already normalized)"""
+    return _assemble(tickers, _score_kernel(_batch_seeds(tickers)))
+
+# Batches above this size have the kernel split across worker threads
+PARALLEL_BATCH_MIN = 256
+
+async def batch_score_parallel(tickers: List[str]) -> List[EvaluationResult]:
+    """batch_score, with large batches chunked across cores via asyncio.to_thread"""
+    if len(tickers) <= PARALLEL_BATCH_MIN:
+        return batch_score(tickers)
+    
+    chunks = np.array_split(_batch_seeds(tickers), os.cpu_count() or 1)
+    parts = await asyncio.gather(*(asyncio.to_thread(_score_kernel, c) for c in chunks))
+    columns = tuple(np.concatenate(col) for col in zip(*parts))
+    return _assemble(tickers, columns)
+
+def _categorize(summary: Dict, result: EvaluationResult):
+    """Add one result to a running batch summary"""
+    if result.run_score >= 75:
+        summary["high_potential"].append(result.ticker)
+    elif result.run_score >= 50:
+        summary["moderate"].append(result.ticker)
+    else:
+        summary["duds"].append(result.ticker)
+    summary["total"] += 1
+
+def _empty_summary() -> Dict:
+    return {"total": 0, "high_potential": [], "moderate": [], "duds": []}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the batch kernel so the first /batch doesn't pay JIT compile time"""
+    start_logging()
+    batch_score(["SPY"])
+    yield
+    logger.info("shutdown")
+    stop_logging()
+
 # FastAPI app
 app = FastAPI(
     title="Breakout Run Potential Evaluation Engine",
     description="Three-pillar analysis for breakout run potential",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -109,32 +240,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.get("/")
-def root():
-    return {
-        "service": "Breakout Run Potential Evaluation Engine",
-        "version": "1.0.0",
-        "status": "running",
-        "endpoints": {
-            "evaluate": "POST /evaluate",
-            "batch": "POST /batch",
-            "health": "GET /health",
-            "stripe_webhook": "POST /webhook/stripe"
-        }
+# uvicorn's access log is off; only failed requests are logged
+@app.middleware("http")
+async def log_failed_requests(request: Request, call_next):
+    response = await call_next(request)
+    if response.status_code >= 400:
+        logger.warning("request_failed", extra={
+            "method": request.method,
+            "path": request.url.path,
+            "status": response.status_code
+        })
+    return response
+
+# Static service info, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "service": "Breakout Run Potential Evaluation Engine",
+    "version": "1.0.0",
+    "status": "running",
+    "endpoints": {
+        "evaluate": "POST /evaluate",
+        "batch": "POST /batch",
+        "batch_stream": "POST /batch/stream",
+        "health": "GET /health",
+        "stripe_webhook": "POST /webhook/stripe",
+        "cache_clear": "POST /cache/clear"
     }
+})
+
+@app.get("/")
+async def root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
-def health():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat()
-    }
+async def health():
+    return Response(
+        content=orjson.dumps({"status": "healthy", "timestamp": _iso_now()}),
+        media_type="application/json"
+    )
 
 @app.post("/evaluate")
 async def evaluate(request: EvaluateRequest):
     """Evaluate a single ticker"""
     try:
-        result = simple_evaluate(request.ticker.upper().strip())
+        result = simple_evaluate(request.ticker)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -143,24 +291,48 @@ async def evaluate(request: EvaluateRequest):
 async def batch_evaluate(request: BatchRequest):
     """Evaluate multiple tickers"""
     try:
-        results = [simple_evaluate(t.upper().strip()) for t in request.tickers]
+        tickers = request.tickers
+        
+        # Score each distinct ticker once; repeats reuse the same result
+        unique = list(dict.fromkeys(tickers))
+        scored = dict(zip(unique, await batch_score_parallel(unique)))
+        results = [scored[t] for t in tickers]
         
-        high_potential = [r.ticker for r in results if r.run_score >= 75]
-        moderate = [r.ticker for r in results if 50 <= r.run_score < 75]
-        duds = [r.ticker for r in results if r.run_score < 50]
+        summary = _empty_summary()
+        for r in results:
+            _categorize(summary, r)
         
         return {
             "evaluations": results,
-            "summary": {
-                "total": len(results),
-                "high_potential": high_potential,
-                "moderate": moderate,
-                "duds": duds
-            }
+            "summary": summary
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Tickers scored per step of /batch/stream
+STREAM_CHUNK = 256
+
+@app.post("/batch/stream")
+async def batch_evaluate_stream(request: BatchRequest):
+    """Evaluate multiple tickers as NDJSON: one evaluation per line, then a summary line"""
+    tickers = request.tickers
+    
+    def lines():
+        # Score in bounded chunks and flush each before scoring the next, so only
+        # one chunk's results are held and the first rows go out immediately
+        summary = _empty_summary()
+        for i in range(0, len(tickers), STREAM_CHUNK):
+            chunk = tickers[i:i + STREAM_CHUNK]
+            unique = list(dict.fromkeys(chunk))
+            scored = dict(zip(unique, batch_score(unique)))
+            for ticker in chunk:
+                result = scored[ticker]
+                _categorize(summary, result)
+                yield orjson.dumps(result) + b"\n"
+        yield orjson.dumps({"summary": summary}) + b"\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @app.get("/evaluate/{ticker}")
 async def evaluate_get(ticker: str):
     """Quick evaluate endpoint via GET"""
@@ -170,6 +342,15 @@ async def evaluate_get(ticker: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/cache/clear")
+async def cache_clear(x_admin_token: str = Header(default='')):
+    """Drop memoized evaluations (admin - requires the X-Admin-Token header)"""
+    if not ADMIN_TOKEN or not hmac.compare_digest(x_admin_token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    entries = simple_evaluate.cache_info().currsize
+    simple_evaluate.cache_clear()
+    return {"status": "cleared", "entries": entries}
+
 # Stripe Webhook (simplified)
 @app.post("/webhook/stripe")
 async def stripe_webhook(request: Request):
@@ -178,7 +359,7 @@ async def stripe_webhook(request: Request):
         payload = await request.json()
         event_type = payload.get('type', '')
         
-        print(f"📩 Stripe webhook: {event_type}")
+        logger.info("stripe_webhook", extra={"event_type": event_type})
         
         if event_type == 'checkout.session.completed':
             # TODO: Activate user in Supabase
@@ -200,7 +381,7 @@ async def breakout_scan():
     }
 
 @app.get("/breakout/stocks")
-def get_breakout_stocks(limit: int = 10):
+async def get_breakout_stocks(limit: int = 10):
     """Get recent breakout stocks"""
     return {
         "count": 0,
@@ -209,7 +390,7 @@ def get_breakout_stocks(limit: int = 10):
     }
 
 @app.get("/breakout/performance")
-def get_breakout_performance(days: int = 7):
+async def get_breakout_performance(days: int = 7):
     """Get performance tracking"""
     return {
         "period_days": days,
@@ -223,4 +404,14 @@ if __name__ == "__main__":
     print("="*70)
     print("🚀 Breakout Run API Server (Simplified)")
     print("="*70)
-    uvicorn.run(app, host="0.0.0.0", port=8082)
+    # workers > 1 needs the import string rather than the app object
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8082)),
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2)),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False
+    )
@@ -6,42 +6,76 @@ FastAPI Server for Breakout Run Potential Evaluation Engine
 import os
 import sys
 import asyncio
+import time
+import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import Response
 import uvicorn
+import orjson
+from dotenv import load_dotenv
 
 # Add current directory to path so imports work when running from backend/
-import os
-import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Entry point loads .env once, before anything reads credentials
+load_dotenv()
+
 # Now imports will work
 from engine import RunPotentialEngine, EvaluationResult
-from full_scanner import FullBreakoutScanner, BreakoutStock
+from data_fetchers.enhanced_narrative_fetcher import close_shared_session
 from stripe_webhook import StripeWebhookHandler
+from responses import ORJSONResponse
+from clients import get_supabase
+from logging_config import start_logging, stop_logging
+from models import EvaluateRequest, BatchRequest, WebhookRequest, EvaluationResponse
+
+logger = logging.getLogger("breakout")
 
 # Global engine instance
 engine: Optional[RunPotentialEngine] = None
 
+# Dashboard query results, keyed by (endpoint, param, time bucket) so entries
+# expire when the bucket rolls over
+QUERY_CACHE_TTL = 30  # seconds
+_query_cache: Dict[Tuple[str, int, int], dict] = {}
+
+def _query_cache_key(endpoint: str, param: int) -> Tuple[str, int, int]:
+    return (endpoint, param, int(time.time() // QUERY_CACHE_TTL))
+
+def _query_cache_put(key: Tuple[str, int, int], value: dict):
+    # Evict entries from earlier buckets so the cache stays bounded
+    for stale in [k for k in _query_cache if k[2] != key[2]]:
+        del _query_cache[stale]
+    _query_cache[key] = value
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan"""
     global engine
-    engine = RunPotentialEngine()
-    print("🚀 Engine initialized")
-    yield
-    print("👋 Shutting down")
+    start_logging()
+    # One Supabase client for the process, shared with the Stripe handler and scanner
+    app.state.supabase = get_supabase()
+    app.state.stripe_handler = StripeWebhookHandler() if app.state.supabase else None
+    # The engine holds its fetchers' pooled sessions open for the app's lifetime
+    async with RunPotentialEngine() as engine:
+        logger.info("engine_initialized")
+        yield
+        logger.info("shutdown")
+    engine = None
+    await close_shared_session()
+    stop_logging()
 
 app = FastAPI(
     title="Breakout Run Potential Evaluation Engine",
     description="Three-pillar analysis for breakout run potential",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -53,56 +87,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Pydantic models
-class EvaluateRequest(BaseModel):
-    ticker: str
-
-class BatchRequest(BaseModel):
-    tickers: List[str]
+# uvicorn's access log is off; only failed requests are logged
+@app.middleware("http")
+async def log_failed_requests(request: Request, call_next):
+    response = await call_next(request)
+    if response.status_code >= 400:
+        logger.warning("request_failed", extra={
+            "method": request.method,
+            "path": request.url.path,
+            "status": response.status_code
+        })
+    return response
 
-class WebhookRequest(BaseModel):
-    tickers: str  # Comma-separated
-    source: Optional[str] = "webhook"
-
-class EvaluationResponse(BaseModel):
-    ticker: str
-    run_score: int
-    verdict: str
-    institutional_score: float
-    narrative_score: float
-    other_score: float
-    reasoning: str
-    upside_projection: str
-    fakeout_risk: str
-    watch_for: List[str]
-    timestamp: str
-    institutional_details: dict
-    narrative_details: dict
-    other_details: dict
-    decision_framework: dict
-    comparables: List[dict]
+# Static service info, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "service": "Breakout Run Potential Evaluation Engine",
+    "version": "1.0.0",
+    "status": "running",
+    "endpoints": {
+        "evaluate": "POST /evaluate",
+        "batch": "POST /batch",
+        "webhook": "POST /webhook",
+        "health": "GET /health"
+    }
+})
 
+# Handlers are async def and run on the event loop. Blocking SDK calls
+# (Supabase, Stripe, Twilio) inside them must go through asyncio.to_thread;
+# a handler that is blocking end to end can instead be a plain def, which
+# FastAPI runs on its threadpool.
 @app.get("/")
-def root():
-    return {
-        "service": "Breakout Run Potential Evaluation Engine",
-        "version": "1.0.0",
-        "status": "running",
-        "endpoints": {
-            "evaluate": "POST /evaluate",
-            "batch": "POST /batch",
-            "webhook": "POST /webhook",
-            "health": "GET /health"
-        }
-    }
+async def root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
-def health():
-    return {
-        "status": "healthy",
-        "engine_ready": engine is not None,
-        "timestamp": datetime.now().isoformat()
-    }
+async def health():
+    return Response(
+        content=orjson.dumps({
+            "status": "healthy",
+            "engine_ready": engine is not None,
+            "timestamp": datetime.now().isoformat()
+        }),
+        media_type="application/json"
+    )
 
 @app.post("/evaluate", response_model=EvaluationResponse)
 async def evaluate(request: EvaluateRequest):
@@ -111,8 +138,7 @@ async def evaluate(request: EvaluateRequest):
         raise HTTPException(status_code=503, detail="Engine not initialized")
     
     try:
-        ticker = request.ticker.upper().strip()
-        result = await engine.evaluate(ticker)
+        result = await engine.evaluate(request.ticker)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -124,23 +150,26 @@ async def batch_evaluate(request: BatchRequest):
         raise HTTPException(status_code=503, detail="Engine not initialized")
     
     try:
-        tickers = [t.upper().strip() for t in request.tickers]
-        results = await engine.evaluate_batch(tickers)
+        results = await engine.evaluate_batch(request.tickers)
         
         # Categorize results
         high_potential = [r.ticker for r in results if r.run_score >= 75]
         moderate = [r.ticker for r in results if 50 <= r.run_score < 75]
         duds = [r.ticker for r in results if r.run_score < 50]
         
-        return {
-            "evaluations": [r.__dict__ for r in results],
-            "summary": {
-                "total": len(results),
-                "high_potential": high_potential,
-                "moderate": moderate,
-                "duds": duds
-            }
-        }
+        # orjson walks the result dataclasses directly, skipping jsonable_encoder's asdict copies
+        return Response(
+            content=orjson.dumps({
+                "evaluations": results,
+                "summary": {
+                    "total": len(results),
+                    "high_potential": high_potential,
+                    "moderate": moderate,
+                    "duds": duds
+                }
+            }, default=dict),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -165,20 +194,54 @@ async def webhook(request: WebhookRequest, background_tasks: BackgroundTasks):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def store_evaluations(results: List[EvaluationResult], source: str):
+    """Persist batch evaluations to the evaluations table in one bulk insert
+    (blocking - run via asyncio.to_thread)"""
+    supabase = get_supabase()
+    if supabase is None or not results:
+        return
+    supabase.table('evaluations').insert([
+        {
+            'ticker': r.ticker,
+            'run_score': r.run_score,
+            'verdict': r.verdict,
+            'institutional_score': r.institutional_score,
+            'narrative_score': r.narrative_score,
+            'other_score': r.other_score,
+            'upside_projection': r.upside_projection,
+            'fakeout_risk': r.fakeout_risk,
+            'reasoning': r.reasoning,
+            'source': source,
+            'evaluated_at': r.timestamp
+        }
+        for r in results
+    ]).execute()
+
+def send_high_potential_alert(high_scores: List[EvaluationResult]):
+    """Alert on high potential tickers (blocking - run via asyncio.to_thread)"""
+    if not high_scores:
+        return
+    logger.info("high_potential", extra={"tickers": [r.ticker for r in high_scores]})
+    # TODO: Send Telegram alert
+
 async def process_webhook_batch(tickers: List[str], source: str):
     """Process webhook batch asynchronously"""
-    print(f"🔄 Processing webhook batch from {source}: {tickers}")
+    logger.info("webhook_batch", extra={"source": source, "count": len(tickers)})
     
     results = await engine.evaluate_batch(tickers)
-    
-    # Log results
     high_scores = [r for r in results if r.run_score >= 75]
-    if high_scores:
-        print(f"🎯 High potential tickers found: {[r.ticker for r in high_scores]}")
-        # TODO: Send Telegram alert
     
-    # TODO: Store in Supabase
-    print(f"✅ Batch complete. {len(results)} tickers evaluated.")
+    # Storage and alerting are sync SDK calls - overlap them off the event loop
+    outcomes = await asyncio.gather(
+        asyncio.to_thread(store_evaluations, results, source),
+        asyncio.to_thread(send_high_potential_alert, high_scores),
+        return_exceptions=True
+    )
+    for step, outcome in zip(("store_evaluations", "high_potential_alert"), outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"{step}_failed", extra={"error": str(outcome)})
+    
+    logger.info("webhook_batch_complete", extra={"source": source, "count": len(results)})
 
 @app.get("/evaluate/{ticker}")
 async def evaluate_get(ticker: str):
@@ -188,12 +251,12 @@ async def evaluate_get(ticker: str):
     
     try:
         result = await engine.evaluate(ticker.upper().strip())
-        return result
+        return Response(content=result.to_json_bytes(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/history/{ticker}")
-def get_history(ticker: str):
+async def get_history(ticker: str):
     """Get historical evaluations for a ticker"""
     # TODO: Query from Supabase
     return {
@@ -206,6 +269,8 @@ def get_history(ticker: str):
 @app.post("/breakout/scan")
 async def breakout_scan(background_tasks: BackgroundTasks):
     """Run full S&P 500 breakout scan - stores results in Supabase"""
+    # Imported on first scan: keeps the scanner's numba kernel out of worker startup
+    from full_scanner import FullBreakoutScanner
     try:
         scanner = FullBreakoutScanner()
         results = await scanner.run_full_scan()
@@ -231,6 +296,7 @@ async def breakout_scan(background_tasks: BackgroundTasks):
 @app.post("/breakout/scan-and-send")
 async def breakout_scan_and_send(phone: str, background_tasks: BackgroundTasks):
     """Run scan and send SMS to specific phone number"""
+    from full_scanner import FullBreakoutScanner
     try:
         scanner = FullBreakoutScanner()
         results = await scanner.run_full_scan()
@@ -256,43 +322,47 @@ async def breakout_scan_and_send(phone: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/breakout/stocks")
-def get_breakout_stocks(limit: int = 10):
+async def get_breakout_stocks(request: Request, limit: int = 10):
     """Get recent breakout stocks from Supabase"""
+    supabase = request.app.state.supabase
+    if not supabase:
+        raise HTTPException(status_code=503, detail="Supabase not configured")
+    
+    key = _query_cache_key('breakout_stocks', limit)
+    if key in _query_cache:
+        return _query_cache[key]
+    
     try:
-        from supabase import create_client
-        import os
-        
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
-        
         # Get recent alerts from last 7 days
         cutoff = (datetime.now() - timedelta(days=7)).isoformat()
-        result = supabase.table('sent_alerts').select('*').gte('sent_at', cutoff).order('sent_at', desc=True).limit(limit).execute()
+        query = supabase.table('sent_alerts').select('*').gte('sent_at', cutoff).order('sent_at', desc=True).limit(limit)
+        result = await asyncio.to_thread(query.execute)
         
-        return {
+        response = {
             "count": len(result.data),
             "alerts": result.data
         }
+        _query_cache_put(key, response)
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/breakout/performance")
-def get_breakout_performance(days: int = 7):
+async def get_breakout_performance(request: Request, days: int = 7):
     """Get performance tracking for alerts"""
+    supabase = request.app.state.supabase
+    if not supabase:
+        raise HTTPException(status_code=503, detail="Supabase not configured")
+    
+    key = _query_cache_key('breakout_performance', days)
+    if key in _query_cache:
+        return _query_cache[key]
+    
     try:
-        from supabase import create_client
-        import os
-        
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
-        
         # Get performance data
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-        result = supabase.table('alert_performance').select('*').gte('created_at', cutoff).execute()
+        query = supabase.table('alert_performance').select('*').gte('created_at', cutoff)
+        result = await asyncio.to_thread(query.execute)
         
         # Calculate stats
         data = result.data
@@ -300,7 +370,7 @@ def get_breakout_performance(days: int = 7):
         winners = len([d for d in data if d.get('gain_1d', 0) > 0])
         avg_gain = sum([d.get('gain_1d', 0) for d in data]) / total if total > 0 else 0
         
-        return {
+        response = {
             "period_days": days,
             "total_alerts": total,
             "winners": winners,
@@ -308,6 +378,8 @@ def get_breakout_performance(days: int = 7):
             "avg_gain_1d": round(avg_gain, 2),
             "performance": data
         }
+        _query_cache_put(key, response)
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -315,15 +387,16 @@ def get_breakout_performance(days: int = 7):
 @app.post("/webhook/stripe")
 async def stripe_webhook(request: Request):
     """Receive Stripe webhooks for payment events"""
+    handler = request.app.state.stripe_handler
+    if not handler:
+        raise HTTPException(status_code=503, detail="Supabase not configured")
+    
     try:
-        # Import already done at top of file
-        handler = StripeWebhookHandler()
-        
         payload = await request.body()
         sig_header = request.headers.get('stripe-signature', '')
         
-        handler = StripeWebhookHandler()
-        result = handler.process_webhook(payload, sig_header)
+        # Supabase/Twilio calls inside are blocking
+        result = await asyncio.to_thread(handler.process_webhook, payload, sig_header)
         
         if result['status'] == 'error':
             raise HTTPException(status_code=400, detail=result['message'])
@@ -344,7 +417,19 @@ if __name__ == "__main__":
     print("  POST /batch          - Evaluate multiple tickers")
     print("  POST /webhook        - Webhook from alert system")
     print("  GET  /evaluate/{ticker} - Quick evaluate")
-    print("\nRunning on http://localhost:8082")
+    port = int(os.getenv("PORT", 8082))
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2))
+    print(f"\nRunning on http://localhost:{port} ({workers} workers)")
     print("="*70)
     
-    uvicorn.run(app, host="0.0.0.0", port=8082)
+    # workers > 1 needs the import string rather than the app object
+    uvicorn.run(
+        "api_server:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False
+    )
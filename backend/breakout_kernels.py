@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Breakout indicator kernels for the full scanner
+Right-aligned, NaN-padded (N, bars) close/volume matrices -> (N, 9) indicators
+"""
+
+import numpy as np
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:  # optional: pip install numba for the JIT kernel
+    _NUMBA_AVAILABLE = False
+
+# Column order of the indicator matrix
+INDICATORS = ('latest_close', 'upper_band', 'price_change', 'rsi', 'volume',
+              'avg_volume', 'volume_ratio', 'recent_vol', 'hist_vol')
+
+def breakout_indicators_numpy(closes: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+    """Indicators for many tickers at once, as whole-matrix NumPy ops
+    
+    Only the latest value of each rolling indicator is scored, so each is
+    computed over its trailing window alone rather than the full rolling series.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # RSI - 14-bar mean gain/loss
+        delta = np.diff(closes[:, -15:], axis=1)
+        gain = np.where(delta > 0, delta, 0).mean(axis=1)
+        loss = np.where(delta < 0, -delta, 0).mean(axis=1)
+        rsi = 100 - (100 / (1 + gain / loss))
+        
+        # Bollinger Bands - 20-bar SMA + 2 std
+        window = closes[:, -20:]
+        upper_band = window.mean(axis=1) + window.std(axis=1, ddof=1) * 2
+        
+        latest_close = closes[:, -1]
+        price_change = (latest_close - closes[:, -2]) / closes[:, -2] * 100
+        
+        # Volume vs 20-bar average
+        volume = volumes[:, -1]
+        avg_volume = volumes[:, -20:].mean(axis=1)
+        volume_ratio = np.where(avg_volume > 0, volume / avg_volume, 0)
+        
+        # Volatility - last 5 bars vs whole history
+        recent_vol = closes[:, -5:].std(axis=1, ddof=1)
+        hist_vol = np.nanstd(closes, axis=1, ddof=1)
+    
+    return np.column_stack([latest_close, upper_band, price_change, rsi, volume,
+                            avg_volume, volume_ratio, recent_vol, hist_vol])
+
+if _NUMBA_AVAILABLE:
+    # No fastmath: the padding is NaN and hist_vol has to skip it.
+    # error_model='numpy' so a flat 14 bars gives RSI inf/NaN like NumPy, not ZeroDivisionError
+    @numba.njit(cache=True, nogil=True, error_model='numpy')
+    def _mean_std(x):
+        """Mean and sample std (ddof=1) of the non-NaN values in x, two-pass"""
+        total = 0.0
+        count = 0
+        for v in x:
+            if v == v:
+                total += v
+                count += 1
+        mean = total / count
+        sq = 0.0
+        for v in x:
+            if v == v:
+                sq += (v - mean) ** 2
+        return mean, np.sqrt(sq / (count - 1))
+    
+    @numba.njit(cache=True, nogil=True, error_model='numpy')
+    def breakout_indicators_jit(closes, volumes):
+        """Fused per-ticker loop; same windows as breakout_indicators_numpy"""
+        n, bars = closes.shape
+        out = np.empty((n, 9), dtype=np.float64)
+        for i in range(n):
+            c = closes[i]
+            v = volumes[i]
+            
+            gain = 0.0
+            loss = 0.0
+            for j in range(bars - 14, bars):
+                d = c[j] - c[j - 1]
+                if d > 0:
+                    gain += d
+                elif d < 0:
+                    loss -= d
+            rsi = 100 - (100 / (1 + (gain / 14) / (loss / 14)))
+            
+            sma, std = _mean_std(c[bars - 20:])
+            latest = c[bars - 1]
+            
+            avg_volume = 0.0
+            for j in range(bars - 20, bars):
+                avg_volume += v[j]
+            avg_volume /= 20
+            
+            out[i, 0] = latest
+            out[i, 1] = sma + std * 2
+            out[i, 2] = (latest - c[bars - 2]) / c[bars - 2] * 100
+            out[i, 3] = rsi
+            out[i, 4] = v[bars - 1]
+            out[i, 5] = avg_volume
+            out[i, 6] = v[bars - 1] / avg_volume if avg_volume > 0 else 0.0
+            out[i, 7] = _mean_std(c[bars - 5:])[1]
+            out[i, 8] = _mean_std(c)[1]
+        return out
+    
+    breakout_indicators = breakout_indicators_jit
+else:
+    breakout_indicators = breakout_indicators_numpy
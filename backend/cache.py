@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+On-disk TTL cache for scanner inputs
+Price histories as .npy arrays, small payloads (ticker lists) as JSON
+"""
+
+import io
+import os
+import re
+import time
+import tempfile
+from typing import Any, Optional
+
+import numpy as np
+import orjson
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+def _safe(part: str) -> str:
+    # Tickers like BRK.B / BF-B are fine in file names; anything else is replaced
+    return re.sub(r"[^A-Za-z0-9._-]", "_", part)
+
+class FileCache:
+    """Files under root/{namespace}/{key}; an entry is fresh while its mtime is within ttl"""
+
+    def __init__(self, root: str = None):
+        self.root = root or os.getenv("SCAN_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+    def _path(self, namespace: str, key: str) -> str:
+        return os.path.join(self.root, _safe(namespace), _safe(key))
+
+    @staticmethod
+    def _fresh(path: str, ttl: float) -> bool:
+        try:
+            return time.time() - os.path.getmtime(path) < ttl
+        except OSError:
+            return False
+
+    def _write(self, path: str, data: bytes):
+        """Write via a temp file + rename so readers never see a partial entry"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get_array(self, namespace: str, key: str, ttl: float) -> Optional[np.ndarray]:
+        path = self._path(namespace, key + ".npy")
+        if not self._fresh(path, ttl):
+            return None
+        try:
+            return np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+
+    def put_array(self, namespace: str, key: str, value: np.ndarray):
+        path = self._path(namespace, key + ".npy")
+        buf = io.BytesIO()
+        np.save(buf, value, allow_pickle=False)
+        self._write(path, buf.getvalue())
+
+    def get_json(self, namespace: str, key: str, ttl: float) -> Optional[Any]:
+        path = self._path(namespace, key + ".json")
+        if not self._fresh(path, ttl):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def put_json(self, namespace: str, key: str, value: Any):
+        self._write(self._path(namespace, key + ".json"), orjson.dumps(value))
+
+    def delete_json(self, namespace: str, key: str):
+        try:
+            os.unlink(self._path(namespace, key + ".json"))
+        except FileNotFoundError:
+            pass
+
+    def prune(self, namespace: str, ttl: float):
+        """Delete every file in namespace older than ttl - reads only skip them"""
+        root = os.path.join(self.root, _safe(namespace))
+        try:
+            entries = list(os.scandir(root))
+        except FileNotFoundError:
+            return
+        cutoff = time.time() - ttl
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
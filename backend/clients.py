@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Process-wide Supabase and Twilio clients
+Built once on first use and reused by the API, the scanner and the Stripe handler
+"""
+
+import os
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def get_supabase():
+    """Shared Supabase client, or None when SUPABASE_URL / SUPABASE_KEY are unset"""
+    url, key = os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_KEY')
+    if not url or not key:
+        return None
+    from supabase import create_client
+    return create_client(url, key)
+
+@lru_cache(maxsize=1)
+def get_twilio():
+    """Shared Twilio client, or None when the account SID / auth token are unset"""
+    sid, token = os.getenv('TWILIO_ACCOUNT_SID'), os.getenv('TWILIO_AUTH_TOKEN')
+    if not sid or not token:
+        return None
+    from twilio.rest import Client
+    return Client(sid, token)
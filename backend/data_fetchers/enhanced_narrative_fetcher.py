@@ -5,12 +5,27 @@ Implements detailed narrative scoring with real data sources
 """
 
 import os
+import re
+import time
+import random
 import asyncio
+import functools
+import heapq
 import aiohttp
+import orjson
+from aiohttp.resolver import AsyncResolver, DefaultResolver
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
+import numpy as np
+
+try:
+    import aiodns  # noqa: F401 - backs aiohttp's AsyncResolver
+    _AIODNS_AVAILABLE = True
+except ImportError:  # optional: pip install aiodns for non-blocking DNS
+    _AIODNS_AVAILABLE = False
 
 # Add parent directory to path so imports work
 import sys
@@ -22,7 +37,81 @@ from data_fetchers.web_search import WebSearchFetcher
 
 load_dotenv()
 
-@dataclass
+# Per-source result lifetimes - X chatter moves fastest, earnings slowest
+X_CACHE_TTL = 5 * 60
+NEWS_CACHE_TTL = 15 * 60
+EARNINGS_CACHE_TTL = 60 * 60
+
+# X API requests retried on 429/5xx with exponential backoff
+X_MAX_ATTEMPTS = 4
+
+# Search query templates, filled per ticker with .format(t=ticker, ...)
+_X_QUERY_TMPLS: Tuple[str, ...] = (
+    "${t} (breakout OR run OR squeeze OR pump) min_faves:{min_faves}",
+    "${t} (bullish OR moon OR rocket OR undervalued) min_faves:{min_faves}",
+    "#{t} (trading OR swing OR position) min_faves:{min_faves}",
+)
+_UPGRADE_QUERY_TMPL = '"{t}" (upgrade OR "target raise" OR "price target" OR "outperform" OR "buy rating") site:seekingalpha.com OR site:benzinga.com OR site:marketwatch.com OR site:reuters.com OR site:bloomberg.com'
+_NEWS_QUERY_TMPL = '"{t}" stock news today site:seekingalpha.com OR site:benzinga.com OR site:marketwatch.com OR site:cnbc.com'
+_TRANSCRIPT_QUERY_TMPL = '"{t}" earnings call transcript Q4 2025 OR Q1 2026 site:seekingalpha.com OR site:fool.com OR site:benzinga.com'
+_GUIDANCE_QUERY_TMPL = '"{t}" guidance "raised" OR "increased" OR "stronger" OR "beat" site:benzinga.com OR site:seekingalpha.com'
+
+# Sentiment keywords
+_POS_KW: Tuple[str, ...] = ('upgrade', 'raise', 'bullish', 'outperform', 'buy', 'strong', 'growth')
+_NEG_KW: Tuple[str, ...] = ('downgrade', 'cut', 'bearish', 'underperform', 'sell', 'weak', 'concern')
+_STRONG_KW: Tuple[str, ...] = ('beat', 'raised', 'increased', 'stronger', 'outperform', 'exceeded')
+_WEAK_KW: Tuple[str, ...] = ('missed', 'lowered', 'decreased', 'weaker', 'underperform', 'challenging')
+
+def _keyword_re(keywords: Tuple[str, ...]) -> re.Pattern:
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# Keyword scanners - one pass over the text per list. A keyword counts
+# once per result (substring match, as with `kw in text`), so callers
+# count the distinct matches
+POS_RE = _keyword_re(_POS_KW)
+NEG_RE = _keyword_re(_NEG_KW)
+STRONG_RE = _keyword_re(_STRONG_KW)
+WEAK_RE = _keyword_re(_WEAK_KW)
+
+# Score ladders, highest threshold first
+_X_ENGAGEMENT_TIERS = ((70, 25), (50, 20), (30, 15))  # engagement_score > t -> component
+_VERDICT_THRESHOLDS = ((75, 'viral_narrative'), (60, 'strong_narrative'),
+                       (45, 'building_narrative'), (30, 'weak_narrative'))  # total >= t
+
+# Insight fragments keyed by verdict / earnings inflection
+_INSIGHT_HEADERS = {
+    'viral_narrative': "🔥 VIRAL momentum across all channels",
+    'strong_narrative': "📈 Strong narrative developing",
+    'building_narrative': "📊 Narrative building but early",
+}
+_INSIGHT_EARNINGS = {
+    'strong_positive': "Strong earnings beat with raised guidance",
+    'positive': "Positive earnings narrative",
+}
+
+def _ttl_cached(ttl: float):
+    """Cache a search method's result per (method, args) on the instance for ttl seconds.
+    Error results are not cached so the next call retries. Every caller within the
+    ttl gets the same result dict - treat it as read-only."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            entry = self._cache.get(key)
+            now = time.monotonic()
+            if entry is not None and now < entry[0]:
+                return entry[1]
+            result = await func(self, *args, **kwargs)
+            if 'error' not in result:
+                # Drop expired entries so the cache only holds recently searched tickers
+                for stale in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                    del self._cache[stale]
+                self._cache[key] = (now + ttl, result)
+            return result
+        return wrapper
+    return decorator
+
+@dataclass(slots=True, frozen=True)
 class XSearchResult:
     text: str
     likes: int
@@ -32,6 +121,38 @@ class XSearchResult:
     created_at: datetime
     sentiment: str
 
+@dataclass(slots=True)
+class TweetColumns:
+    """Engagement-filtered tweets stored column-wise (struct of arrays) so
+    aggregates reduce over flat lists instead of per-tweet dicts"""
+    ids: List[Optional[str]] = field(default_factory=list)
+    likes: List[int] = field(default_factory=list)
+    retweets: List[int] = field(default_factory=list)
+    replies: List[int] = field(default_factory=list)
+    impressions: List[int] = field(default_factory=list)
+    followers: List[int] = field(default_factory=list)
+    verified: List[bool] = field(default_factory=list)
+    records: List[Dict] = field(default_factory=list)  # full tweets, only for top_tweets
+    
+    def __len__(self) -> int:
+        return len(self.likes)
+    
+    def extend_unique(self, other: 'TweetColumns', seen_ids: Set[str]):
+        """Append other's rows, skipping tweets whose id is already in seen_ids"""
+        for i, tweet_id in enumerate(other.ids):
+            if tweet_id is not None:
+                if tweet_id in seen_ids:
+                    continue
+                seen_ids.add(tweet_id)
+            self.ids.append(tweet_id)
+            self.likes.append(other.likes[i])
+            self.retweets.append(other.retweets[i])
+            self.replies.append(other.replies[i])
+            self.impressions.append(other.impressions[i])
+            self.followers.append(other.followers[i])
+            self.verified.append(other.verified[i])
+            self.records.append(other.records[i])
+
 class EnhancedNarrativeFetcher:
     """
     Fetches comprehensive narrative data:
@@ -40,22 +161,165 @@ class EnhancedNarrativeFetcher:
     - Web search for earnings/guidance
     """
     
+    # One pooled session per process so keep-alive connections to
+    # api.twitter.com are reused across tickers instead of re-handshaking
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _shared_loop: Optional[asyncio.AbstractEventLoop] = None
+    
     def __init__(self):
         self.x_bearer = os.getenv('X_BEARER_TOKEN')
         self.base_url = "https://api.twitter.com/2"
         self.web_search = WebSearchFetcher()
         self.session: Optional[aiohttp.ClientSession] = None
+        # Cap in-flight requests so batch scans don't trip X rate limits
+        # or pile up on the connector
+        self._x_sem = asyncio.Semaphore(8)
+        self._web_sem = asyncio.Semaphore(16)
+        # (method, args, kwargs) -> (expires_at, payload); see _ttl_cached
+        self._cache: Dict[tuple, Tuple[float, Dict]] = {}
+        # The token can't appear after startup. Without one every X query
+        # would 401 into an empty result - bind that result once instead
+        if not self.x_bearer:
+            self.search_x_keyword_semantic = self._search_x_unconfigured
+    
+    @classmethod
+    def _get_shared_session(cls, x_bearer: str) -> aiohttp.ClientSession:
+        """Return the process-wide session, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        # A session is bound to the loop that created it
+        if cls._shared_session is not None and not cls._shared_session.closed and cls._shared_loop is not loop:
+            cls._release_stale_session()
+        if cls._shared_session is None or cls._shared_session.closed or cls._shared_loop is not loop:
+            cls._shared_session = aiohttp.ClientSession(
+                headers={"Authorization": f"Bearer {x_bearer}"},
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+                connector=aiohttp.TCPConnector(
+                    resolver=AsyncResolver() if _AIODNS_AVAILABLE else DefaultResolver(),
+                    limit=100,
+                    limit_per_host=64,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300
+                )
+            )
+            cls._shared_loop = loop
+        return cls._shared_session
+    
+    @classmethod
+    def _release_stale_session(cls):
+        """Let go of a session left on another loop (e.g. after a previous asyncio.run)
+        
+        If that loop is still running in another thread the session is closed there.
+        Otherwise it can't be awaited from here - its sockets belong to the old loop -
+        so the connector is detached: the session stops reporting itself unclosed and
+        the sockets are released with the old loop rather than rebound to this one.
+        """
+        stale, stale_loop = cls._shared_session, cls._shared_loop
+        cls._shared_session = None
+        if stale_loop is not None and stale_loop.is_running():
+            asyncio.run_coroutine_threadsafe(stale.close(), stale_loop)
+        else:
+            stale.detach()
+    
+    async def start(self):
+        """Attach the pooled session; no-op if already started"""
+        if self.session is None or self.session.closed:
+            self.session = self._get_shared_session(self.x_bearer)
+    
+    async def close(self):
+        # The shared session outlives this fetcher - see close_shared_session()
+        self.session = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={"Authorization": f"Bearer {self.x_bearer}"}
-        )
+        await self.start()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.close()
+    
+    async def _web_search(self, query: str, freshness: str, count: int) -> List[Dict]:
+        """Web search bounded by the shared web semaphore"""
+        async with self._web_sem:
+            return await self.web_search.search(query, freshness=freshness, count=count)
+    
+    async def _get_x_json(self, url: str, params: Dict) -> Dict:
+        """GET an X API endpoint, retrying rate limits and server errors with backoff.
+        Raises once retries are exhausted or on a non-retryable status, so a failed
+        query can't be mistaken for one that found no tweets."""
+        for attempt in range(X_MAX_ATTEMPTS):
+            async with self._x_sem, self.session.get(url, params=params) as resp:
+                if resp.status == 200:
+                    return orjson.loads(await resp.read())
+                if resp.status == 429:
+                    # Wait for the window reset, capped by the backoff step
+                    reset_in = int(resp.headers.get('x-rate-limit-reset', 0)) - time.time()
+                    delay = min(max(1, reset_in), 2 ** attempt)
+                elif resp.status >= 500:
+                    delay = 2 ** attempt + random.random()
+                else:
+                    raise RuntimeError(f"X API returned HTTP {resp.status}")
+            # Back off outside the semaphore so other queries can proceed
+            if attempt < X_MAX_ATTEMPTS - 1:
+                await asyncio.sleep(delay)
+        raise RuntimeError(f"X API still failing after {X_MAX_ATTEMPTS} attempts")
+    
+    async def _run_x_query(self, query: str, min_faves: int, max_results: int) -> TweetColumns:
+        """Run one X recent-search query and return the engagement-filtered tweets"""
+        url = f"{self.base_url}/tweets/search/recent"
+        params = {
+            'query': query,
+            'max_results': min(50, max_results),
+            'tweet.fields': 'created_at,public_metrics,author_id',
+            'expansions': 'author_id',
+            'user.fields': 'public_metrics,verified'
+        }
+        
+        cols = TweetColumns()
+        data = await self._get_x_json(url, params)
+        tweets = data.get('data', [])
+        
+        # Get user data for follower counts
+        users = {u['id']: u for u in data.get('includes', {}).get('users', [])}
+        
+        for tweet in tweets:
+            metrics = tweet.get('public_metrics', {})
+            author_id = tweet.get('author_id')
+            author = users.get(author_id, {})
+        
+            likes = metrics.get('like_count', 0)
+            retweets = metrics.get('retweet_count', 0)
+            replies = metrics.get('reply_count', 0)
+        
+            # Filter by engagement quality - the query's min_faves operator
+            # already enforces the like floor server-side
+            if likes + retweets + replies >= min_faves * 2:
+                impressions = metrics.get('impression_count', 0)
+                followers = author.get('public_metrics', {}).get('followers_count', 0)
+                verified = author.get('verified', False)
+        
+                cols.ids.append(tweet.get('id'))
+                cols.likes.append(likes)
+                cols.retweets.append(retweets)
+                cols.replies.append(replies)
+                cols.impressions.append(impressions)
+                cols.followers.append(followers)
+                cols.verified.append(verified)
+                cols.records.append({
+                    'text': tweet.get('text', ''),
+                    'likes': likes,
+                    'retweets': retweets,
+                    'replies': replies,
+                    'impressions': impressions,
+                    'author_followers': followers,
+                    'verified': verified,
+                    'created_at': tweet.get('created_at')
+                })
+        return cols
     
+    async def _search_x_unconfigured(self, ticker: str, min_faves: int = 10, max_results: int = 100) -> Dict:
+        """search_x_keyword_semantic stand-in when X_BEARER_TOKEN is unset"""
+        return {'found': False, 'engagement_score': 0}
+    
+    @_ttl_cached(X_CACHE_TTL)
     async def search_x_keyword_semantic(
         self, 
         ticker: str, 
@@ -67,98 +331,76 @@ class EnhancedNarrativeFetcher:
         Query: ticker + (breakout OR run OR moon OR squeeze OR pump)
         """
         try:
-            # Build semantic query for trading/breakout context
-            queries = [
-                f"${ticker} (breakout OR run OR squeeze OR pump) min_faves:{min_faves}",
-                f"${ticker} (bullish OR moon OR rocket OR undervalued) min_faves:{min_faves}",
-                f"#{ticker} (trading OR swing OR position) min_faves:{min_faves}"
-            ]
-            
-            all_tweets = []
-            
-            for query in queries[:2]:  # Limit to 2 queries to save API calls
-                url = f"{self.base_url}/tweets/search/recent"
-                params = {
-                    'query': query,
-                    'max_results': min(50, max_results),
-                    'tweet.fields': 'created_at,public_metrics,author_id,context_annotations',
-                    'expansions': 'author_id',
-                    'user.fields': 'public_metrics,verified'
-                }
-                
-                async with self.session.get(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        tweets = data.get('data', [])
-                        
-                        # Get user data for follower counts
-                        users = {u['id']: u for u in data.get('includes', {}).get('users', [])}
-                        
-                        for tweet in tweets:
-                            metrics = tweet.get('public_metrics', {})
-                            author_id = tweet.get('author_id')
-                            author = users.get(author_id, {})
-                            
-                            # Filter by engagement quality
-                            total_engagement = metrics.get('like_count', 0) + \
-                                             metrics.get('retweet_count', 0) + \
-                                             metrics.get('reply_count', 0)
-                            
-                            if metrics.get('like_count', 0) >= min_faves or total_engagement >= min_faves * 2:
-                                all_tweets.append({
-                                    'text': tweet.get('text', ''),
-                                    'likes': metrics.get('like_count', 0),
-                                    'retweets': metrics.get('retweet_count', 0),
-                                    'replies': metrics.get('reply_count', 0),
-                                    'impressions': metrics.get('impression_count', 0),
-                                    'author_followers': author.get('public_metrics', {}).get('followers_count', 0),
-                                    'verified': author.get('verified', False),
-                                    'created_at': tweet.get('created_at'),
-                                    'context': tweet.get('context_annotations', [])
-                                })
-            
-            if not all_tweets:
-                return {'found': False, 'engagement_score': 0}
-            
-            # Calculate metrics
-            total_likes = sum(t['likes'] for t in all_tweets)
-            total_retweets = sum(t['retweets'] for t in all_tweets)
-            total_replies = sum(t['replies'] for t in all_tweets)
-            total_impressions = sum(t.get('impressions', 0) for t in all_tweets)
-            
-            # Weight by author influence
-            weighted_engagement = sum(
-                (t['likes'] * 1 + t['retweets'] * 2 + t['replies'] * 1.5) * 
-                (1 + (t['author_followers'] / 10000))  # Boost for larger accounts
-                for t in all_tweets
+            # Semantic queries for trading/breakout context. Limit to 2 queries
+            # to save API calls; both go out on the shared session at once
+            queries = [tmpl.format(t=ticker, min_faves=min_faves) for tmpl in _X_QUERY_TMPLS[:2]]
+            results = await asyncio.gather(
+                *(self._run_x_query(q, min_faves, max_results) for q in queries),
+                return_exceptions=True
             )
             
+            # The queries overlap, so the same tweet can come back twice -
+            # count each one once
+            all_tweets = TweetColumns()
+            seen_ids: Set[str] = set()
+            failures = []
+            for result in results:
+                if isinstance(result, Exception):
+                    failures.append(result)
+                else:
+                    all_tweets.extend_unique(result, seen_ids)
+            # A failed query leaves the result incomplete - the 'error' key keeps
+            # _ttl_cached from serving it for the whole TTL
+            error = {'error': str(failures[0])} if failures else {}
+            
+            tweet_count = len(all_tweets)
+            if not tweet_count:
+                return {'found': False, 'engagement_score': 0, **error}
+            
+            # Calculate metrics - plain totals via C-level sum() over the columns
+            total_likes = sum(all_tweets.likes)
+            total_retweets = sum(all_tweets.retweets)
+            total_replies = sum(all_tweets.replies)
+            total_impressions = sum(all_tweets.impressions)
+            has_verified_mentions = any(all_tweets.verified)
+            
+            likes = np.array(all_tweets.likes, dtype=np.int64)
+            retweets = np.array(all_tweets.retweets, dtype=np.int64)
+            replies = np.array(all_tweets.replies, dtype=np.int64)
+            followers = np.array(all_tweets.followers, dtype=np.int64)
+            
+            # Weight by author influence - boost for larger accounts
+            # Float for the viral threshold; reported and bucketed as a whole number
+            weighted_engagement = float(((likes + 2 * retweets + 1.5 * replies) * (1 + followers / 10000)).sum())
+            engagement_whole = int(weighted_engagement)
+            
             # Check for viral indicators
-            viral_tweets = [t for t in all_tweets if t['likes'] >= 100 or t['retweets'] >= 50]
-            has_verified_mentions = any(t['verified'] for t in all_tweets)
+            viral_tweet_count = int(np.count_nonzero((likes >= 100) | (retweets >= 50)))
             
             # Determine if "viral"
-            is_viral = len(viral_tweets) >= 3 or weighted_engagement > 5000
+            is_viral = viral_tweet_count >= 3 or weighted_engagement > 5000
             
             return {
                 'found': True,
-                'tweet_count': len(all_tweets),
-                'viral_tweet_count': len(viral_tweets),
+                'tweet_count': tweet_count,
+                'viral_tweet_count': viral_tweet_count,
                 'total_likes': total_likes,
                 'total_retweets': total_retweets,
                 'total_replies': total_replies,
                 'total_impressions': total_impressions,
-                'weighted_engagement': round(weighted_engagement, 0),
+                'weighted_engagement': engagement_whole,
                 'is_viral': is_viral,
                 'has_verified_mentions': has_verified_mentions,
-                'avg_likes': round(total_likes / len(all_tweets), 1),
-                'top_tweets': sorted(all_tweets, key=lambda x: x['likes'], reverse=True)[:5],
-                'engagement_score': min(100, int(weighted_engagement / 100))  # Normalize to 0-100
+                'avg_likes': round(total_likes / tweet_count, 1),
+                'top_tweets': heapq.nlargest(5, all_tweets.records, key=itemgetter('likes')),
+                'engagement_score': min(100, engagement_whole // 100),  # Normalize to 0-100
+                **error
             }
             
         except Exception as e:
             return {'found': False, 'error': str(e), 'engagement_score': 0}
     
+    @_ttl_cached(NEWS_CACHE_TTL)
     async def search_news_upgrades(self, ticker: str) -> Dict:
         """
         Web search for news, analyst upgrades, target changes
@@ -166,21 +408,15 @@ class EnhancedNarrativeFetcher:
         """
         try:
             # Search for upgrades and positive news
-            upgrade_query = f'"{ticker}" (upgrade OR "target raise" OR "price target" OR "outperform" OR "buy rating") site:seekingalpha.com OR site:benzinga.com OR site:marketwatch.com OR site:reuters.com OR site:bloomberg.com'
-            
-            upgrade_results = await self.web_search.search(
-                upgrade_query, 
-                freshness='day',  # Last 24 hours
-                count=10
-            )
+            upgrade_query = _UPGRADE_QUERY_TMPL.format(t=ticker)
             
             # Search for general news
-            news_query = f'"{ticker}" stock news today site:seekingalpha.com OR site:benzinga.com OR site:marketwatch.com OR site:cnbc.com'
+            news_query = _NEWS_QUERY_TMPL.format(t=ticker)
             
-            news_results = await self.web_search.search(
-                news_query,
-                freshness='day',
-                count=10
+            # Independent queries - run both at once (last 24 hours)
+            upgrade_results, news_results = await asyncio.gather(
+                self._web_search(upgrade_query, freshness='day', count=10),
+                self._web_search(news_query, freshness='day', count=10)
             )
             
             # Analyze sentiment of results
@@ -188,19 +424,14 @@ class EnhancedNarrativeFetcher:
             news_mentions = len(news_results)
             
             # Check for positive framing shifts
-            positive_keywords = ['upgrade', 'raise', 'bullish', 'outperform', 'buy', 'strong', 'growth']
-            negative_keywords = ['downgrade', 'cut', 'bearish', 'underperform', 'sell', 'weak', 'concern']
-            
             positive_count = 0
             negative_count = 0
             
             for result in upgrade_results + news_results:
-                title = result.get('title', '').lower()
-                snippet = result.get('snippet', '').lower()
-                text = title + ' ' + snippet
+                text = (result.get('title', '') + ' ' + result.get('snippet', '')).lower()
                 
-                positive_count += sum(1 for kw in positive_keywords if kw in text)
-                negative_count += sum(1 for kw in negative_keywords if kw in text)
+                positive_count += len(set(POS_RE.findall(text)))
+                negative_count += len(set(NEG_RE.findall(text)))
             
             total_sentiment = positive_count + negative_count
             sentiment_ratio = positive_count / total_sentiment if total_sentiment > 0 else 0.5
@@ -236,43 +467,33 @@ class EnhancedNarrativeFetcher:
         except Exception as e:
             return {'error': str(e), 'framing_score': 0}
     
+    @_ttl_cached(EARNINGS_CACHE_TTL)
     async def search_earnings_guidance(self, ticker: str) -> Dict:
         """
         Web search for earnings transcripts and guidance
         """
         try:
             # Search for earnings transcript
-            transcript_query = f'"{ticker}" earnings call transcript Q4 2025 OR Q1 2026 site:seekingalpha.com OR site:fool.com OR site:benzinga.com'
-            
-            transcript_results = await self.web_search.search(
-                transcript_query,
-                freshness='week',  # Last 7 days
-                count=5
-            )
+            transcript_query = _TRANSCRIPT_QUERY_TMPL.format(t=ticker)
             
             # Search for guidance highlights
-            guidance_query = f'"{ticker}" guidance "raised" OR "increased" OR "stronger" OR "beat" site:benzinga.com OR site:seekingalpha.com'
+            guidance_query = _GUIDANCE_QUERY_TMPL.format(t=ticker)
             
-            guidance_results = await self.web_search.search(
-                guidance_query,
-                freshness='week',
-                count=5
+            # Independent queries - run both at once (last 7 days)
+            transcript_results, guidance_results = await asyncio.gather(
+                self._web_search(transcript_query, freshness='week', count=5),
+                self._web_search(guidance_query, freshness='week', count=5)
             )
             
             # Analyze for narrative inflection
-            inflection_keywords = {
-                'strong': ['beat', 'raised', 'increased', 'stronger', 'outperform', 'exceeded'],
-                'weak': ['missed', 'lowered', 'decreased', 'weaker', 'underperform', 'challenging']
-            }
-            
             strong_signals = 0
             weak_signals = 0
             
             for result in transcript_results + guidance_results:
                 text = (result.get('title', '') + ' ' + result.get('snippet', '')).lower()
                 
-                strong_signals += sum(1 for kw in inflection_keywords['strong'] if kw in text)
-                weak_signals += sum(1 for kw in inflection_keywords['weak'] if kw in text)
+                strong_signals += len(set(STRONG_RE.findall(text)))
+                weak_signals += len(set(WEAK_RE.findall(text)))
             
             total_signals = strong_signals + weak_signals
             
@@ -317,8 +538,8 @@ class EnhancedNarrativeFetcher:
         except Exception as e:
             return {'error': str(e), 'earnings_score': 0}
     
+    @staticmethod
     async def calculate_narrative_score(
-        self, 
         x_data: Dict, 
         news_data: Dict, 
         earnings_data: Dict
@@ -332,14 +553,11 @@ class EnhancedNarrativeFetcher:
         # X engagement component (0-30)
         if x_data.get('is_viral'):
             x_component = 30
-        elif x_data.get('engagement_score', 0) > 70:
-            x_component = 25
-        elif x_data.get('engagement_score', 0) > 50:
-            x_component = 20
-        elif x_data.get('engagement_score', 0) > 30:
-            x_component = 15
         else:
-            x_component = max(5, x_data.get('engagement_score', 0) / 4)
+            engagement = x_data.get('engagement_score', 0)
+            x_component = next((c for t, c in _X_ENGAGEMENT_TIERS if engagement > t), None)
+            if x_component is None:
+                x_component = max(5, engagement / 4)
         
         # News framing component (0-20)
         framing_component = news_data.get('framing_score', 0)
@@ -359,16 +577,7 @@ class EnhancedNarrativeFetcher:
         total_score = min(100, raw_score)
         
         # Determine verdict
-        if total_score >= 75:
-            verdict = 'viral_narrative'
-        elif total_score >= 60:
-            verdict = 'strong_narrative'
-        elif total_score >= 45:
-            verdict = 'building_narrative'
-        elif total_score >= 30:
-            verdict = 'weak_narrative'
-        else:
-            verdict = 'no_narrative'
+        verdict = next((v for t, v in _VERDICT_THRESHOLDS if total_score >= t), 'no_narrative')
         
         return total_score, {
             'total_score': total_score,
@@ -382,61 +591,66 @@ class EnhancedNarrativeFetcher:
             'x_data': x_data,
             'news_data': news_data,
             'earnings_data': earnings_data,
-            'key_insight': self._generate_narrative_insight(x_data, news_data, earnings_data, verdict)
+            'key_insight': EnhancedNarrativeFetcher._generate_narrative_insight(x_data, news_data, earnings_data, verdict)
         }
     
+    @staticmethod
     def _generate_narrative_insight(
-        self, 
         x_data: Dict, 
         news_data: Dict, 
         earnings_data: Dict,
         verdict: str
     ) -> str:
         """Generate human-readable narrative insight"""
-        parts = []
-        
-        if verdict == 'viral_narrative':
-            parts.append("🔥 VIRAL momentum across all channels")
-        elif verdict == 'strong_narrative':
-            parts.append("📈 Strong narrative developing")
-        elif verdict == 'building_narrative':
-            parts.append("📊 Narrative building but early")
-        else:
-            parts.append("📉 Limited narrative traction")
+        header = _INSIGHT_HEADERS.get(verdict, "📉 Limited narrative traction")
         
         # X details
+        tweet_count = x_data.get('tweet_count', 0)
         if x_data.get('is_viral'):
-            parts.append(f"{x_data.get('viral_tweet_count', 0)} viral tweets with {x_data.get('total_likes', 0):,} likes")
-        elif x_data.get('tweet_count', 0) > 50:
-            parts.append(f"{x_data.get('tweet_count')} mentions with solid engagement")
+            x_part = f"{x_data.get('viral_tweet_count', 0)} viral tweets with {x_data.get('total_likes', 0):,} likes"
+        else:
+            x_part = f"{tweet_count} mentions with solid engagement" if tweet_count > 50 else None
         
         # News details
-        if news_data.get('upgrade_mentions', 0) > 0:
-            parts.append(f"{news_data.get('upgrade_mentions')} analyst upgrades")
+        upgrades = news_data.get('upgrade_mentions', 0)
+        news_part = f"{upgrades} analyst upgrades" if upgrades > 0 else None
         
         # Earnings details
-        if earnings_data.get('narrative_inflection') == 'strong_positive':
-            parts.append("Strong earnings beat with raised guidance")
-        elif earnings_data.get('narrative_inflection') == 'positive':
-            parts.append("Positive earnings narrative")
+        earn_part = _INSIGHT_EARNINGS.get(earnings_data.get('narrative_inflection'))
         
-        return " | ".join(parts)
+        return " | ".join(filter(None, (header, x_part, news_part, earn_part)))
     
     async def fetch_all(self, ticker: str) -> Tuple[float, Dict]:
         """Fetch all narrative data and calculate score"""
-        print(f"  📱 Searching X/Twitter for ${ticker}...")
-        x_data = await self.search_x_keyword_semantic(ticker)
+        print(f"  📱📰📊 Searching X/Twitter, news/upgrades and earnings/guidance for ${ticker}...")
         
-        print(f"  📰 Searching news/upgrades for ${ticker}...")
-        news_data = await self.search_news_upgrades(ticker)
+        # The three sources are independent - wait only as long as the slowest
+        x_data, news_data, earnings_data = await asyncio.gather(
+            self.search_x_keyword_semantic(ticker),
+            self.search_news_upgrades(ticker),
+            self.search_earnings_guidance(ticker),
+            return_exceptions=True
+        )
         
-        print(f"  📊 Searching earnings/guidance for ${ticker}...")
-        earnings_data = await self.search_earnings_guidance(ticker)
+        # Keep the error-dict shape each search returns on failure
+        if isinstance(x_data, Exception):
+            x_data = {'found': False, 'error': str(x_data), 'engagement_score': 0}
+        if isinstance(news_data, Exception):
+            news_data = {'error': str(news_data), 'framing_score': 0}
+        if isinstance(earnings_data, Exception):
+            earnings_data = {'error': str(earnings_data), 'earnings_score': 0}
         
         score, details = await self.calculate_narrative_score(x_data, news_data, earnings_data)
         
         return score, details
 
+async def close_shared_session():
+    """Close the pooled X session - call once at application shutdown"""
+    session = EnhancedNarrativeFetcher._shared_session
+    EnhancedNarrativeFetcher._shared_session = None
+    if session and not session.closed:
+        await session.close()
+
 
 # Test
 async def main():
@@ -445,6 +659,7 @@ async def main():
         print(f"\nNarrative Score: {score}")
         print(f"Breakdown: {details['breakdown']}")
         print(f"Insight: {details['key_insight']}")
+    await close_shared_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,26 +4,197 @@ Core Evaluation Engine
 Orchestrates three-pillar analysis and generates rich reports
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import asyncio
-import json
+import bisect
+import time
+from collections.abc import Mapping
+from contextlib import AsyncExitStack
 from datetime import datetime
-from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
-from dotenv import load_dotenv
+from typing import Any, Callable, Dict, List, Tuple
+from dataclasses import dataclass
+from aiolimiter import AsyncLimiter
+import numpy as np
+import orjson
 
 # Add current directory to path so imports work when running from backend/
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Now imports will work
-from data_fetchers.institutional_fetcher_free import FreeInstitutionalFetcher, InstitutionalAnalyzer
+from data_fetchers.institutional_fetcher_free import FreeInstitutionalFetcher
 from data_fetchers.enhanced_narrative_fetcher import EnhancedNarrativeFetcher
 from data_fetchers.yahoo_fetcher import YahooFetcher
+from scoring_kernels import score_institutional, score_other, TREND_IDS, TREND_OTHER
+
+# Per-provider request budget as (calls, per seconds). Batches are paced
+# by these token buckets rather than a fixed sleep between tickers
+PROVIDER_RATE_LIMITS = {
+    'institutional': (2, 1),
+    'yahoo': (2, 1),
+    'narrative': (2, 1),
+}
+
+# Score ladders. Thresholds are strict (value > t), hence bisect_left
+_VOL_THRESH = (0, 20, 50, 100)
+_VOL_SCORES = (20, 40, 60, 80, 100)
+_OI_THRESH = (0, 10, 20)
+_OI_SCORES = (40, 60, 80, 100)
+_BLOCK_SCORES = (40, 60, 60, 80, 80, 100)  # indexed by min(block_count, 5)
+_TREND_SCORE = {'strong_uptrend': 100, 'uptrend': 80, 'sideways': 60}  # anything else: 40
+
+# Pillar weights for the final run score
+_INST_WEIGHT, _NARR_WEIGHT, _OTHER_WEIGHT = 0.35, 0.35, 0.30
+
+# Upside bands by run score (score >= threshold), lowest band first
+_UPSIDE_THRESH = (50, 60, 75, 85)
+_UPSIDE_STR = ("<10% or negative", "10-25%", "20-50%", "50-150%", "100-300%+")
+
+# Verdict and position-sizing tiers by run score (score >= threshold)
+_TIER_THRESH = (50, 75)
+_VERDICTS = ("Dud/Fakeout", "Moderate", "High Potential")
+
+# Fakeout risk indexed by how many of weak volume / no narrative / technical warnings apply
+_FAKEOUT_RISK = ("Low", "Medium", "High", "High")
 
-load_dotenv()
+# Decision framework scaffolding - identical for every evaluation
+_SIZING = (
+    ("watch", "N/A - wait for better setup"),
+    ("quarter", "6-8% below entry"),
+    ("half", "8-10% below entry"),
+)
+_ENTRY_SIGNALS = (
+    'Volume remains elevated (>1.5x avg)',
+    'Price holds above breakout level',
+    'No distribution patterns on volume',
+    'Social sentiment remains positive'
+)
+_EXIT_SIGNALS = (
+    'Volume drops below 20-day average',
+    'Breaks below key support with volume',
+    'RSI divergence forms on daily',
+    'Social sentiment turns negative'
+)
+_TAKE_PROFIT = ('+50% (trim 1/3)', '+100% (trim 1/3)', 'Trail remaining')
+_COMPARABLES_STATIC = (
+    {'ticker': 'PLTR', 'similarity': 82, 'outcome': '+245% over 8 months',
+     'lessons': 'Similar government contract growth + AI narrative'},
+    {'ticker': 'NVDA', 'similarity': 75, 'outcome': '+180% over 6 months',
+     'lessons': 'AI infrastructure buildout theme'},
+    {'ticker': 'AEVA', 'similarity': 68, 'outcome': '+890% over 4 months',
+     'lessons': 'LiDAR + automotive adoption narrative'}
+)
 
-@dataclass
+# Evaluations are reused for this long - repeat lookups skip all three fetches
+EVALUATION_CACHE_TTL = 60  # seconds
+
+# (epoch second, ISO string) - rebound as one tuple so readers never see a torn pair
+_ts_cache: Tuple[int, str] = (0, "")
+
+def _iso_now() -> str:
+    """Current local time in ISO format, at one-second resolution"""
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _ts_cache[1]
+
+async def _rate_limited(limiter: AsyncLimiter, aw):
+    """Await aw once limiter grants a token"""
+    async with limiter:
+        return await aw
+
+class LazyDetails(Mapping):
+    """Read-only details mapping whose expensive subtrees are built on first access
+    
+    Subclasses list every key in _KEYS (serialization order) and map the lazy ones
+    to builders in _BUILDERS; a builder gets the source data given at construction.
+    """
+    __slots__ = ('_data', '_source')
+    _KEYS: Tuple[str, ...] = ()
+    _BUILDERS: Dict[str, Callable[[Any], Any]] = {}
+    
+    def __init__(self, data: Dict, source: Any):
+        self._data = data
+        self._source = source
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._data[key]
+        except KeyError:
+            value = self._data[key] = self._BUILDERS[key](self._source)
+            return value
+    
+    def __iter__(self):
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+def _build_fundamentals(fund: Dict) -> Dict:
+    metrics = fund.get('metrics') or {}
+    revenue_growth = metrics.get('revenue_growth')
+    market_cap = metrics.get('market_cap')
+    has_growth_story = fund.get('has_growth_story', False)
+    growth_pct = f"+{revenue_growth * 100:.0f}%" if revenue_growth else None
+    return {
+        'earnings_beat': fund.get('earnings_beat', False),
+        'revenue_growth': f"{growth_pct} YoY" if growth_pct else 'N/A',
+        'guidance': 'raised' if has_growth_story else 'maintained',
+        'tam_expansion': has_growth_story,
+        'margin_trend': 'improving' if fund.get('is_fundamentally_healthy') else 'stable',
+        'competitive_position': 'strengthening',
+        'key_metrics': [
+            {'label': 'P/E Ratio', 'value': f"{metrics.get('pe_ratio', 'N/A')}", 'trend': 'neutral'},
+            {'label': 'Revenue Growth', 'value': growth_pct or 'N/A', 'trend': 'up'},
+            {'label': 'Market Cap', 'value': f"${market_cap / 1e9:.1f}B" if market_cap else 'N/A', 'trend': 'neutral'},
+            {'label': 'Beta', 'value': f"{metrics.get('beta', 'N/A')}", 'trend': 'neutral'}
+        ]
+    }
+
+def _build_risks(fund: Dict) -> Dict:
+    return {
+        'sector_headwinds': [],
+        'macro_risks': ['Rising interest rates affecting growth multiples'] if (fund.get('metrics') or {}).get('pe_ratio', 0) > 30 else [],
+        'company_specific': [],
+        'liquidity_concerns': False,
+        'concentration_risk': 'low'
+    }
+
+def _build_catalysts(fund: Dict) -> Dict:
+    return {
+        'upcoming': [
+            {'date': 'Next Earnings', 'event': 'Q1 Earnings Release', 'impact': 'high'},
+            {'date': 'TBD', 'event': 'Analyst Day', 'impact': 'medium'}
+        ],
+        'recent': [
+            {'date': 'Last Month', 'event': 'Previous Earnings', 'outcome': 'Beat estimates'}
+        ] if fund.get('earnings_beat') else []
+    }
+
+class OtherDetails(LazyDetails):
+    """Other-factors details; fundamentals/risks/catalysts are formatted on demand"""
+    __slots__ = ()
+    _KEYS = ('technical_score', 'fundamental_score', 'risk_score', 'key_insight',
+             'technical_analysis', 'fundamentals', 'risks', 'catalysts')
+    _BUILDERS = {
+        'fundamentals': _build_fundamentals,
+        'risks': _build_risks,
+        'catalysts': _build_catalysts,
+    }
+    
+    @property
+    def earnings_beat(self) -> bool:
+        """fundamentals.earnings_beat without building the fundamentals subtree"""
+        return bool(self._source.get('earnings_beat', False))
+
+# Frozen so cached instances can be handed to concurrent requests safely
+@dataclass(slots=True, frozen=True)
 class EvaluationResult:
     ticker: str
     run_score: int
@@ -40,58 +211,54 @@ class EvaluationResult:
     narrative_details: Dict
     other_details: Dict
     decision_framework: Dict
-    comparables: List[Dict]
+    comparables: Tuple[Dict, ...]
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes - orjson walks the dataclass, no asdict copy"""
+        return orjson.dumps(self, default=dict)  # default: lazy details mappings
 
 class InstitutionalAnalyzer:
     """Analyzes institutional activity - 35% weight"""
     
+    @staticmethod
+    def has_data(polygon_data: Dict) -> bool:
+        return not ('error' in polygon_data.get('volume_data', {}) or 'error' in polygon_data.get('options_data', {}))
+    
+    @staticmethod
+    def unavailable() -> Tuple[float, Dict]:
+        return 50.0, {'error': 'Insufficient data', 'key_insight': 'Data unavailable'}
+    
     async def analyze(self, polygon_data: Dict) -> Tuple[float, Dict]:
         """Calculate institutional score from Polygon data"""
-        volume_data = polygon_data.get('volume_data', {})
-        options_data = polygon_data.get('options_data', {})
-        block_data = polygon_data.get('block_data', {})
-        
-        if 'error' in volume_data or 'error' in options_data:
-            return 50.0, {'error': 'Insufficient data', 'key_insight': 'Data unavailable'}
+        if not self.has_data(polygon_data):
+            return self.unavailable()
         
         # Volume score
-        vol_vs_avg = volume_data.get('volume_vs_avg_pct', 0)
-        if vol_vs_avg > 100:
-            volume_score = 100
-        elif vol_vs_avg > 50:
-            volume_score = 80
-        elif vol_vs_avg > 20:
-            volume_score = 60
-        elif vol_vs_avg > 0:
-            volume_score = 40
-        else:
-            volume_score = 20
+        vol_vs_avg = polygon_data.get('volume_data', {}).get('volume_vs_avg_pct', 0)
+        volume_score = _VOL_SCORES[bisect.bisect_left(_VOL_THRESH, vol_vs_avg)]
         
         # Options OI score
-        oi_skew = options_data.get('oi_skew_pct', 0)
-        if oi_skew > 20:
-            oi_score = 100
-        elif oi_skew > 10:
-            oi_score = 80
-        elif oi_skew > 0:
-            oi_score = 60
-        else:
-            oi_score = 40
+        oi_skew = polygon_data.get('options_data', {}).get('oi_skew_pct', 0)
+        oi_score = _OI_SCORES[bisect.bisect_left(_OI_THRESH, oi_skew)]
         
         # Block trades score
-        block_count = block_data.get('block_trades_count', 0)
-        if block_count >= 5:
-            block_score = 100
-        elif block_count >= 3:
-            block_score = 80
-        elif block_count >= 1:
-            block_score = 60
-        else:
-            block_score = 40
+        block_count = polygon_data.get('block_data', {}).get('block_trades_count', 0)
+        block_score = _BLOCK_SCORES[max(0, min(int(block_count), 5))]
         
         # Weighted score
         score = (volume_score * 0.5 + oi_score * 0.35 + block_score * 0.15)
         
+        return score, self.details(polygon_data, volume_score, oi_score, block_score)
+    
+    def details(self, polygon_data: Dict, volume_score: int, oi_score: int, block_score: int) -> Dict:
+        """Build the institutional details from the raw data and component scores"""
+        volume_data = polygon_data.get('volume_data', {})
+        options_data = polygon_data.get('options_data', {})
+        block_data = polygon_data.get('block_data', {})
+        vol_vs_avg = volume_data.get('volume_vs_avg_pct', 0)
+        oi_skew = options_data.get('oi_skew_pct', 0)
+        block_count = block_data.get('block_trades_count', 0)
+        
         # Generate insights
         if volume_score >= 80 and oi_score >= 60:
             key_insight = "Strong institutional conviction - volume surge + bullish OI"
@@ -106,7 +273,7 @@ class InstitutionalAnalyzer:
             key_insight = "Mixed institutional signals"
             smart_money = "Unclear institutional stance"
         
-        return score, {
+        return {
             'volume_vs_avg': vol_vs_avg,
             'volume_score': volume_score,
             'volume_trend': volume_data.get('volume_trend', 'stable'),
@@ -123,40 +290,38 @@ class InstitutionalAnalyzer:
 class NarrativeAnalyzer:
     """Analyzes narrative strength - 35% weight using enhanced fetcher"""
     
-    def __init__(self):
-        self.fetcher = EnhancedNarrativeFetcher()
+    def __init__(self, fetcher: EnhancedNarrativeFetcher):
+        # Started by RunPotentialEngine.__aenter__ - shared across tickers
+        self.fetcher = fetcher
     
     async def analyze(self, ticker: str) -> Tuple[float, Dict]:
         """Calculate narrative score using X + Web Search"""
-        async with self.fetcher:
-            score, details = await self.fetcher.fetch_all(ticker)
-        
-        return score, details
+        return await self.fetcher.fetch_all(ticker)
 
 class OtherFactorsAnalyzer:
     """Analyzes technicals, fundamentals, risks - 30% weight"""
     
+    @staticmethod
+    def has_data(yahoo_data: Dict) -> bool:
+        return 'error' not in yahoo_data.get('technical', {})
+    
+    @staticmethod
+    def unavailable() -> Tuple[float, Dict]:
+        return 50.0, {'error': 'Technical data unavailable'}
+    
     async def analyze(self, yahoo_data: Dict) -> Tuple[float, Dict]:
         """Calculate other factors score from Yahoo data"""
+        if not self.has_data(yahoo_data):
+            return self.unavailable()
+        
         tech = yahoo_data.get('technical', {})
         fund = yahoo_data.get('fundamental', {})
         
-        if 'error' in tech:
-            return 50.0, {'error': 'Technical data unavailable'}
-        
         # Technical score
-        rsi = tech.get('rsi', 50)
         trend = tech.get('trend', 'sideways')
         warnings = tech.get('warning_flags', [])
         
-        if trend == 'strong_uptrend':
-            tech_score = 100
-        elif trend == 'uptrend':
-            tech_score = 80
-        elif trend == 'sideways':
-            tech_score = 60
-        else:
-            tech_score = 40
+        tech_score = _TREND_SCORE.get(trend, 40)
         
         # Penalize for warnings
         tech_score -= len(warnings) * 10
@@ -176,99 +341,126 @@ class OtherFactorsAnalyzer:
         # Weighted score
         score = (tech_score * 0.45 + fund_score * 0.35 + risk_score * 0.20)
         
-        return score, {
+        return score, self.details(yahoo_data, tech_score, fund_score, risk_score)
+    
+    def details(self, yahoo_data: Dict, tech_score: int, fund_score: int, risk_score: int) -> OtherDetails:
+        """Build the other-factors details from the raw data and component scores"""
+        tech = yahoo_data.get('technical', {})
+        warnings = tech.get('warning_flags', [])
+        
+        return OtherDetails({
             'technical_score': tech_score,
             'fundamental_score': fund_score,
             'risk_score': risk_score,
             'key_insight': f"{'Clean' if not warnings else 'Cautionary'} technical setup with {'strong' if fund_score >= 80 else 'moderate'} fundamentals",
             'technical_analysis': {
-                'trend': trend,
+                'trend': tech.get('trend', 'sideways'),
                 'support_level': tech.get('support_level', 0),
                 'resistance_level': tech.get('resistance_level', 0),
-                'rsi': rsi,
+                'rsi': tech.get('rsi', 50),
                 'macd_signal': tech.get('macd_signal', 'neutral'),
                 'pattern_detected': tech.get('pattern_detected', 'None'),
                 'breakout_quality': 'clean' if not warnings else 'messy',
                 'volume_confirmation': tech.get('follow_through') == 'strong',
                 'follow_through': tech.get('follow_through', 'weak'),
                 'warning_flags': warnings
-            },
-            'fundamentals': {
-                'earnings_beat': fund.get('earnings_beat', False),
-                'revenue_growth': f"+{fund.get('metrics', {}).get('revenue_growth', 0) * 100:.0f}% YoY" if fund.get('metrics', {}).get('revenue_growth') else 'N/A',
-                'guidance': 'raised' if fund.get('has_growth_story') else 'maintained',
-                'tam_expansion': fund.get('has_growth_story', False),
-                'margin_trend': 'improving' if fund.get('is_fundamentally_healthy') else 'stable',
-                'competitive_position': 'strengthening',
-                'key_metrics': [
-                    {'label': 'P/E Ratio', 'value': f"{fund.get('metrics', {}).get('pe_ratio', 'N/A')}", 'trend': 'neutral'},
-                    {'label': 'Revenue Growth', 'value': f"+{fund.get('metrics', {}).get('revenue_growth', 0) * 100:.0f}%" if fund.get('metrics', {}).get('revenue_growth') else 'N/A', 'trend': 'up'},
-                    {'label': 'Market Cap', 'value': f"${fund.get('metrics', {}).get('market_cap', 0) / 1e9:.1f}B" if fund.get('metrics', {}).get('market_cap') else 'N/A', 'trend': 'neutral'},
-                    {'label': 'Beta', 'value': f"{fund.get('metrics', {}).get('beta', 'N/A')}", 'trend': 'neutral'}
-                ]
-            },
-            'risks': {
-                'sector_headwinds': [],
-                'macro_risks': ['Rising interest rates affecting growth multiples'] if fund.get('metrics', {}).get('pe_ratio', 0) > 30 else [],
-                'company_specific': [],
-                'liquidity_concerns': False,
-                'concentration_risk': 'low'
-            },
-            'catalysts': {
-                'upcoming': [
-                    {'date': 'Next Earnings', 'event': 'Q1 Earnings Release', 'impact': 'high'},
-                    {'date': 'TBD', 'event': 'Analyst Day', 'impact': 'medium'}
-                ],
-                'recent': [
-                    {'date': 'Last Month', 'event': 'Previous Earnings', 'outcome': 'Beat estimates'}
-                ] if fund.get('earnings_beat') else []
             }
-        }
+        }, yahoo_data.get('fundamental', {}))
 
 class RunPotentialEngine:
-    """Main engine that orchestrates analysis"""
+    """Main engine that orchestrates analysis
+    Use as `async with RunPotentialEngine() as engine:` - the fetchers and
+    their pooled HTTP sessions are opened once and reused across tickers"""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8):
+        self._inst_fetcher = FreeInstitutionalFetcher()
+        self._narrative_fetcher = EnhancedNarrativeFetcher()
+        self._yahoo_fetcher = YahooFetcher()
+        self._stack = AsyncExitStack()
         self.institutional_analyzer = InstitutionalAnalyzer()
-        self.narrative_analyzer = NarrativeAnalyzer()
+        self.narrative_analyzer = NarrativeAnalyzer(self._narrative_fetcher)
         self.other_analyzer = OtherFactorsAnalyzer()
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._limiters = {
+            provider: AsyncLimiter(calls, period)
+            for provider, (calls, period) in PROVIDER_RATE_LIMITS.items()
+        }
+        # ticker -> (expires_at, result)
+        self._cache: Dict[str, Tuple[float, EvaluationResult]] = {}
+    
+    async def __aenter__(self):
+        await self._stack.enter_async_context(self._inst_fetcher)
+        # Started once here; every NarrativeAnalyzer.analyze call reuses it
+        await self._narrative_fetcher.start()
+        self._stack.push_async_callback(self._narrative_fetcher.close)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._stack.aclose()
     
     async def evaluate(self, ticker: str) -> EvaluationResult:
-        """Run full evaluation on a ticker"""
+        """Run full evaluation on a ticker, reusing one younger than EVALUATION_CACHE_TTL"""
+        cached = self._cache.get(ticker)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        result = await self._evaluate(ticker)
+        self._cache_put(ticker, result)
+        return result
+    
+    def _cache_put(self, ticker: str, result: EvaluationResult):
+        now = time.monotonic()
+        # Drop expired entries so the cache only holds recently seen tickers
+        for stale in [t for t, (expires_at, _) in self._cache.items() if expires_at <= now]:
+            del self._cache[stale]
+        self._cache[ticker] = (now + EVALUATION_CACHE_TTL, result)
+    
+    async def _fetch(self, ticker: str) -> Tuple[Dict, Dict, Tuple[float, Dict]]:
+        """Fetch raw data for all three pillars -> (inst_data, yahoo_data, (narr_score, narr_details))"""
         print(f"🔍 Evaluating {ticker}...")
         
-        # Fetch institutional and other data in parallel
-        # Narrative analyzer fetches its own data (X + Web Search)
-        async with FreeInstitutionalFetcher() as inst_fetcher:
-            inst_task = inst_fetcher.fetch_all(ticker)
-            yahoo_task = asyncio.to_thread(YahooFetcher().fetch_all, ticker)
-            
-            inst_data, yahoo_data = await asyncio.gather(
-                inst_task, yahoo_task
-            )
+        # Fetch all three pillars in parallel - the narrative analyzer fetches
+        # its own data (X + Web Search), so it overlaps the Polygon + Yahoo fetches
+        inst_data, yahoo_data, narrative = await asyncio.gather(
+            _rate_limited(self._limiters['institutional'], self._inst_fetcher.fetch_all(ticker)),
+            _rate_limited(self._limiters['yahoo'], asyncio.to_thread(self._yahoo_fetcher.fetch_all, ticker)),
+            _rate_limited(self._limiters['narrative'], self.narrative_analyzer.analyze(ticker)),
+            return_exceptions=True
+        )
+        
+        # Let every fetch settle before surfacing the first failure
+        for outcome in (inst_data, yahoo_data, narrative):
+            if isinstance(outcome, BaseException):
+                raise outcome
+        
+        return inst_data, yahoo_data, narrative
+    
+    async def _evaluate(self, ticker: str) -> EvaluationResult:
+        """Run full evaluation on a ticker"""
+        inst_data, yahoo_data, (narr_score, narr_details) = await self._fetch(ticker)
         
-        # Run three-pillar analysis
+        # Score the fetched data
         inst_score, inst_details = await self.institutional_analyzer.analyze(inst_data)
-        narr_score, narr_details = await self.narrative_analyzer.analyze(ticker)  # Now fetches its own data
         other_score, other_details = await self.other_analyzer.analyze(yahoo_data)
         
-        # Calculate weighted run score
-        run_score = round(inst_score * 0.35 + narr_score * 0.35 + other_score * 0.30)
+        # Weighted run score, then the threshold classifications
+        run_score = round(inst_score * _INST_WEIGHT + narr_score * _NARR_WEIGHT + other_score * _OTHER_WEIGHT)
+        tier = bisect.bisect_right(_TIER_THRESH, run_score)
+        upside = self._calculate_upside(run_score)
+        fakeout_risk = self._assess_fakeout_risk(inst_score, narr_score, other_details)
         
-        # Determine verdict
-        if run_score >= 75:
-            verdict = "High Potential"
-        elif run_score >= 50:
-            verdict = "Moderate"
-        else:
-            verdict = "Dud/Fakeout"
+        return self._build_result(ticker, run_score, tier, upside, fakeout_risk, inst_score, inst_details,
+                                  narr_score, narr_details, other_score, other_details)
+    
+    def _build_result(self, ticker: str, run_score: int, tier: int, upside: str, fakeout_risk: str,
+                      inst_score: float, inst_details: Dict, narr_score: float, narr_details: Dict,
+                      other_score: float, other_details: Dict) -> EvaluationResult:
+        """Assemble the final evaluation from the scored and classified pillars"""
+        verdict = _VERDICTS[tier]
         
-        # Generate outputs
         reasoning = self._generate_reasoning(run_score, verdict, inst_details, narr_details, other_details)
-        upside = self._calculate_upside(run_score)
-        fakeout_risk = self._assess_fakeout_risk(inst_score, narr_score, other_details)
         watch_for = self._compile_watch_list(inst_details, narr_details, other_details)
-        decision_framework = self._create_decision_framework(run_score, verdict)
+        decision_framework = self._create_decision_framework(tier)
         comparables = self._find_comparables(ticker, run_score)
         
         return EvaluationResult(
@@ -282,7 +474,7 @@ class RunPotentialEngine:
             upside_projection=upside,
             fakeout_risk=fakeout_risk,
             watch_for=watch_for,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_iso_now(),
             institutional_details=inst_details,
             narrative_details=narr_details,
             other_details=other_details,
@@ -291,89 +483,123 @@ class RunPotentialEngine:
         )
     
     def _generate_reasoning(self, score: int, verdict: str, inst: Dict, narr: Dict, other: Dict) -> str:
-        parts = [f"{verdict} — Run Score: {score}/100"]
-        parts.append(f"Institutional: {inst.get('key_insight', 'N/A')}")
-        parts.append(f"Narrative: {narr.get('key_insight', narr.get('verdict', 'N/A'))}")
-        parts.append(f"Setup: {other.get('key_insight', 'N/A')}")
-        return " | ".join(parts)
-    
-    def _calculate_upside(self, score: int) -> str:
-        if score >= 85: return "100-300%+"
-        elif score >= 75: return "50-150%"
-        elif score >= 60: return "20-50%"
-        elif score >= 50: return "10-25%"
-        else: return "<10% or negative"
+        return (f"{verdict} — Run Score: {score}/100"
+                f" | Institutional: {inst.get('key_insight', 'N/A')}"
+                f" | Narrative: {narr.get('key_insight', narr.get('verdict', 'N/A'))}"
+                f" | Setup: {other.get('key_insight', 'N/A')}")
+    
+    @staticmethod
+    def _calculate_upside(score: int) -> str:
+        return _UPSIDE_STR[bisect.bisect_right(_UPSIDE_THRESH, score)]
     
     def _assess_fakeout_risk(self, inst: float, narr: float, other: Dict) -> str:
-        risks = []
-        if inst < 50: risks.append("weak volume")
-        if narr < 50: risks.append("no narrative")
-        if other.get('technical_analysis', {}).get('warning_flags'): risks.append("technical warnings")
-        
-        if len(risks) >= 2: return "High"
-        elif len(risks) == 1: return "Medium"
-        else: return "Low"
+        warned = bool(other.get('technical_analysis', {}).get('warning_flags'))
+        return _FAKEOUT_RISK[(inst < 50) + (narr < 50) + warned]
     
     def _compile_watch_list(self, inst: Dict, narr: Dict, other: Dict) -> List[str]:
-        watch = []
-        if inst.get('volume_vs_avg', 0) > 50:
-            watch.append("Volume sustainability above 1.5x average")
-        if narr.get('x_mention_count', 0) > 100:
-            watch.append("Social sentiment shifts")
-        if other.get('fundamentals', {}).get('earnings_beat'):
-            watch.append("Next earnings catalyst")
-        watch.append("Sector rotation momentum")
-        return watch[:5]
-    
-    def _create_decision_framework(self, score: int, verdict: str) -> Dict:
-        if score >= 75:
-            position = "half"
-            stop = "8-10% below entry"
-        elif score >= 50:
-            position = "quarter"
-            stop = "6-8% below entry"
-        else:
-            position = "watch"
-            stop = "N/A - wait for better setup"
-        
+        rules = (
+            (inst.get('volume_vs_avg', 0) > 50, "Volume sustainability above 1.5x average"),
+            (narr.get('x_mention_count', 0) > 100, "Social sentiment shifts"),
+            # OtherDetails answers this from its source without building fundamentals
+            (getattr(other, 'earnings_beat', False), "Next earnings catalyst"),
+            (True, "Sector rotation momentum"),
+        )
+        return [message for matched, message in rules if matched]
+    
+    @staticmethod
+    def _create_decision_framework(tier: int) -> Dict:
+        position, stop = _SIZING[tier]
+        # Fresh top-level dict; the signal lists are shared immutable tuples
         return {
-            'entry_signals': [
-                'Volume remains elevated (>1.5x avg)',
-                'Price holds above breakout level',
-                'No distribution patterns on volume',
-                'Social sentiment remains positive'
-            ],
-            'exit_signals': [
-                'Volume drops below 20-day average',
-                'Breaks below key support with volume',
-                'RSI divergence forms on daily',
-                'Social sentiment turns negative'
-            ],
+            'entry_signals': _ENTRY_SIGNALS,
+            'exit_signals': _EXIT_SIGNALS,
             'position_sizing': position,
             'time_horizon': '2-6 months optimal',
             'stop_loss_suggestion': stop,
-            'take_profit_levels': ['+50% (trim 1/3)', '+100% (trim 1/3)', 'Trail remaining']
+            'take_profit_levels': _TAKE_PROFIT
         }
     
-    def _find_comparables(self, ticker: str, score: int) -> List[Dict]:
+    @staticmethod
+    def _find_comparables(ticker: str, score: int) -> Tuple[Dict, ...]:
         # Simplified - would query database of past runners
-        return [
-            {'ticker': 'PLTR', 'similarity': 82, 'outcome': '+245% over 8 months', 
-             'lessons': 'Similar government contract growth + AI narrative'},
-            {'ticker': 'NVDA', 'similarity': 75, 'outcome': '+180% over 6 months',
-             'lessons': 'AI infrastructure buildout theme'},
-            {'ticker': 'AEVA', 'similarity': 68, 'outcome': '+890% over 4 months',
-             'lessons': 'LiDAR + automotive adoption narrative'}
-        ]
+        return _COMPARABLES_STATIC
     
-    async def evaluate_batch(self, tickers: List[str]) -> List[EvaluationResult]:
-        """Evaluate multiple tickers"""
+    async def _fetch_guarded(self, ticker: str) -> Tuple[Dict, Dict, Tuple[float, Dict]]:
+        async with self._sem:
+            return await self._fetch(ticker)
+    
+    def _score_batch(self, tickers: List[str], fetched: List[Tuple]) -> List[EvaluationResult]:
+        """Score many tickers' fetched data with the batch kernels"""
+        inst_rows = [f[0] for f in fetched]
+        techs = [f[1].get('technical', {}) for f in fetched]
+        funds = [f[1].get('fundamental', {}) for f in fetched]
+        
+        inst_scores, vol_s, oi_s, blk_s = score_institutional(
+            np.array([d.get('volume_data', {}).get('volume_vs_avg_pct', 0) for d in inst_rows], dtype=np.float64),
+            np.array([d.get('options_data', {}).get('oi_skew_pct', 0) for d in inst_rows], dtype=np.float64),
+            np.array([d.get('block_data', {}).get('block_trades_count', 0) for d in inst_rows], dtype=np.float64)
+        )
+        warn_len = np.array([len(t.get('warning_flags', [])) for t in techs], dtype=np.int64)
+        other_scores, tech_s, fund_s, risk_s = score_other(
+            np.array([TREND_IDS.get(t.get('trend', 'sideways'), TREND_OTHER) for t in techs], dtype=np.int64),
+            warn_len,
+            np.array([bool(f.get('is_fundamentally_healthy')) for f in funds], dtype=np.bool_),
+            np.array([bool(f.get('has_growth_story')) for f in funds], dtype=np.bool_)
+        )
+        
+        # Tickers missing a pillar's data score the analyzers' neutral 50
+        has_inst = np.array([self.institutional_analyzer.has_data(d) for d in inst_rows], dtype=np.bool_)
+        has_other = np.array([self.other_analyzer.has_data(f[1]) for f in fetched], dtype=np.bool_)
+        inst_scores = np.where(has_inst, inst_scores, 50.0)
+        other_scores = np.where(has_other, other_scores, 50.0)
+        narr_scores = np.array([f[2][0] for f in fetched], dtype=np.float64)
+        
+        # Same operation order as the scalar path, so scores match it bit for bit
+        run_scores = np.rint(inst_scores * _INST_WEIGHT + narr_scores * _NARR_WEIGHT + other_scores * _OTHER_WEIGHT).astype(np.int64)
+        
+        # Classify the whole batch in one pass per table
+        tiers = np.searchsorted(_TIER_THRESH, run_scores, side='right')
+        upsides = np.searchsorted(_UPSIDE_THRESH, run_scores, side='right')
+        warned = has_other & (warn_len > 0)
+        risk_counts = (inst_scores < 50).astype(np.int64) + (narr_scores < 50) + warned
+        
         results = []
-        for ticker in tickers:
-            result = await self.evaluate(ticker.strip())
-            results.append(result)
-            await asyncio.sleep(0.5)  # Rate limiting
+        for i, (ticker, (inst_data, yahoo_data, (narr_score, narr_details))) in enumerate(zip(tickers, fetched)):
+            if has_inst[i]:
+                inst_details = self.institutional_analyzer.details(inst_data, int(vol_s[i]), int(oi_s[i]), int(blk_s[i]))
+            else:
+                inst_details = self.institutional_analyzer.unavailable()[1]
+            
+            if has_other[i]:
+                other_details = self.other_analyzer.details(yahoo_data, int(tech_s[i]), int(fund_s[i]), int(risk_s[i]))
+            else:
+                other_details = self.other_analyzer.unavailable()[1]
+            
+            results.append(self._build_result(ticker, int(run_scores[i]), int(tiers[i]), _UPSIDE_STR[upsides[i]],
+                                              _FAKEOUT_RISK[risk_counts[i]], float(inst_scores[i]), inst_details,
+                                              narr_score, narr_details, float(other_scores[i]), other_details))
         return results
+    
+    async def evaluate_batch(self, tickers: List[str]) -> List[EvaluationResult]:
+        """Evaluate multiple (normalized) tickers - each distinct ticker is evaluated once"""
+        unique = list(dict.fromkeys(tickers))
+        now = time.monotonic()
+        evaluated = {}
+        for ticker in unique:
+            cached = self._cache.get(ticker)
+            if cached is not None and now < cached[0]:
+                evaluated[ticker] = cached[1]
+        
+        pending = [t for t in unique if t not in evaluated]
+        if pending:
+            # Up to max_concurrency fetches in flight; provider limiters pace the calls.
+            # Scoring then runs once over the whole batch
+            fetched = await asyncio.gather(*(self._fetch_guarded(t) for t in pending))
+            for ticker, result in zip(pending, self._score_batch(pending, fetched)):
+                evaluated[ticker] = result
+                self._cache_put(ticker, result)
+        
+        return [evaluated[t] for t in tickers]
 
 
 # Export for use
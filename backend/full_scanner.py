@@ -7,18 +7,54 @@ Restores all original stock_screener.py functionality
 import os
 import sys
 import asyncio
+import random
+import time
 import aiohttp
-import yfinance as yf
-import pandas as pd
+import orjson
 import numpy as np
+from aiolimiter import AsyncLimiter
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from cache import FileCache
+from clients import get_supabase, get_twilio
+from breakout_kernels import breakout_indicators
+
 load_dotenv()
 
-@dataclass
+# Yahoo chart endpoint - 60 daily bars per ticker, fetched concurrently
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+YAHOO_CHART_PARAMS = {'range': '60d', 'interval': '1d', 'includeAdjustedClose': 'true'}
+YAHOO_HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'}
+YAHOO_CONCURRENCY = 64
+YAHOO_RATE_LIMIT = (20, 1)  # (requests, per seconds) sustained
+YAHOO_MAX_ATTEMPTS = 4
+
+# On-disk cache lifetimes (seconds). Histories are keyed by date and kept
+# short because today's bar moves until the close. A no-data marker lists the
+# days a ticker came back empty: one miss skips it for the rest of that day,
+# DEAD_TICKER_MISSES on separate days (delisted) skip it until the marker expires
+HISTORY_CACHE_TTL = int(os.getenv('SCAN_HISTORY_TTL', 900))
+DEAD_TICKER_TTL = 7 * 24 * 3600
+DEAD_TICKER_MISSES = 2
+SP500_CACHE_TTL = 7 * 24 * 3600
+
+# In-process S&P 500 list, so per-request scanners skip even the disk read:
+# (expires_at monotonic, tickers) - rebound as one tuple
+SP500_MEMO_TTL = 24 * 3600
+_sp500_memo: Tuple[float, Tuple[str, ...]] = (0.0, ())
+
+# Column layout of the OHLCV arrays returned by _fetch_hist. CLOSE is the
+# split/dividend-adjusted close, as Ticker.history() returned it
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+# Points per breakout condition, in score_breakouts' column order: upper band
+# breakout, volume surge, price momentum, RSI bonus, volatility expansion
+BREAKOUT_WEIGHTS = np.array([70, 30, 40, 20, 20], dtype=np.int64)
+
+@dataclass(slots=True)
 class BreakoutStock:
     ticker: str
     close_price: float
@@ -42,30 +78,61 @@ class FullBreakoutScanner:
     """
     
     def __init__(self):
-        self.supabase_url = os.getenv('SUPABASE_URL')
-        self.supabase_key = os.getenv('SUPABASE_KEY')
-        self.twilio_sid = os.getenv('TWILIO_ACCOUNT_SID')
-        self.twilio_token = os.getenv('TWILIO_AUTH_TOKEN')
         self.twilio_phone = os.getenv('TWILIO_PHONE_NUMBER')
+        self.cache = FileCache()
         self.tickers = self._fetch_sp500_tickers()
+        assert len(set(self.tickers)) == len(self.tickers), "duplicate tickers in scan universe"
+        # Yahoo request pacing, shared by every _fetch_hist in a scan
+        self._yahoo_sem = asyncio.Semaphore(YAHOO_CONCURRENCY)
+        self._yahoo_limiter = AsyncLimiter(*YAHOO_RATE_LIMIT)
+        self._yahoo_resume_at = 0.0  # monotonic; set once Yahoo reports the window spent
         
     def _fetch_sp500_tickers(self) -> List[str]:
-        """Fetch S&P 500 tickers from Wikipedia"""
+        """S&P 500 tickers - process memo, then disk cache, then Wikipedia"""
+        global _sp500_memo
+        expires_at, memo = _sp500_memo
+        if memo and time.monotonic() < expires_at:
+            return list(memo)
+        
+        tickers = self._load_sp500_tickers()
+        if tickers is None:
+            # Not memoized, so the next scanner retries Wikipedia
+            return self._fallback_tickers()
+        _sp500_memo = (time.monotonic() + SP500_MEMO_TTL, tuple(tickers))
+        return list(tickers)
+    
+    def _load_sp500_tickers(self) -> Optional[List[str]]:
+        """Fetch S&P 500 tickers from Wikipedia (cached on disk for SP500_CACHE_TTL)"""
+        cached = self.cache.get_json('sp500', 'constituents', SP500_CACHE_TTL)
+        if cached:
+            return cached
+        
         try:
             import requests
+            import lxml.html
             url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
             headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'}
             response = requests.get(url, headers=headers, timeout=30)
-            tables = pd.read_html(response.text)
-            tickers = tables[0]['Symbol'].tolist()
+            # Symbol column of the constituents table only; Yahoo spells BRK.B as BRK-B
+            tree = lxml.html.fromstring(response.content)
+            cells = tree.xpath('//table[@id="constituents"]//tr/td[1]')
+            tickers = list(dict.fromkeys(td.text_content().strip().replace('.', '-') for td in cells))
+            if not tickers:
+                raise ValueError("constituents table not found")
             print(f"✓ Fetched {len(tickers)} S&P 500 tickers")
+            self.cache.put_json('sp500', 'constituents', tickers)
             return tickers
         except Exception as e:
             print(f"⚠️ Error fetching tickers: {e}")
-            return self._fallback_tickers()
+            return None
     
     def _fallback_tickers(self) -> List[str]:
-        """Fallback S&P 500 list"""
+        """Fallback S&P 500 list, deduped in order"""
+        return list(dict.fromkeys(self._raw_fallback()))
+    
+    @staticmethod
+    def _raw_fallback() -> List[str]:
+        """Hand-maintained fallback list (may repeat symbols)"""
         return ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'AVGO', 'BRK-B', 'WMT',
                 'JPM', 'V', 'XOM', 'UNH', 'ORCL', 'MA', 'HD', 'PG', 'JNJ', 'BAC', 'ABBV', 'KO',
                 'MRK', 'CVX', 'LLY', 'PEP', 'COST', 'TMO', 'ABT', 'MCD', 'ADBE', 'WFC', 'CRM',
@@ -105,83 +172,207 @@ class FullBreakoutScanner:
                 'SEE', 'SCHL', 'IPG', 'VTR', 'ROL', 'BBWI', 'HRL', 'HII', 'ALK', 'CRL',
                 'PNW', 'AAL', 'FRT', 'BWA', 'EVRG', 'FMC', 'WRK']
 
-    def calculate_breakout_score(self, ticker: str) -> Optional[BreakoutStock]:
-        """Calculate breakout score using original algorithm"""
+    @staticmethod
+    def _parse_chart(payload: Dict) -> Optional[np.ndarray]:
+        """Chart API payload -> (bars, 5) float64 OHLCV array, or None"""
+        result = (payload.get('chart') or {}).get('result') or []
+        if not result:
+            return None
+        indicators = result[0].get('indicators') or {}
+        quote = (indicators.get('quote') or [{}])[0]
+        close = ((indicators.get('adjclose') or [{}])[0].get('adjclose')) or quote.get('close')
+        if not close:
+            return None
+        
+        n = len(close)
+        # Yahoo reports missing bars as nulls - numpy turns them into NaN
+        ohlcv = np.array([
+            quote.get('open') or [None] * n,
+            quote.get('high') or [None] * n,
+            quote.get('low') or [None] * n,
+            close,
+            quote.get('volume') or [None] * n
+        ], dtype=np.float64).T
+        return ohlcv[~np.isnan(ohlcv[:, CLOSE])]
+    
+    def _note_rate_headers(self, headers) -> None:
+        """Hold all requests until the window resets once Yahoo reports it exhausted"""
+        remaining = headers.get('x-ratelimit-remaining')
+        reset = headers.get('x-ratelimit-reset')
+        if remaining is None or reset is None or remaining.strip() != '0':
+            return
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="60d")
+            reset_s = float(reset)
+        except ValueError:
+            return
+        # Accept both epoch-seconds and seconds-until-reset
+        wait = reset_s - time.time() if reset_s > 1e9 else reset_s
+        self._yahoo_resume_at = max(self._yahoo_resume_at, time.monotonic() + max(0.0, wait))
+    
+    async def _fetch_hist(self, session: aiohttp.ClientSession, ticker: str) -> Optional[np.ndarray]:
+        """60 days of daily OHLCV for one ticker, retrying 429/5xx with backoff
+        
+        None means Yahoo has no data for the symbol (404 or an empty chart);
+        any other failure raises so it is never cached as a no-data miss.
+        """
+        url = YAHOO_CHART_URL.format(ticker=ticker)
+        for attempt in range(YAHOO_MAX_ATTEMPTS):
+            pause = self._yahoo_resume_at - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
             
-            if hist.empty or len(hist) < 20:
-                return None
-
-            close_prices = hist['Close']
-            volumes = hist['Volume']
-
-            # RSI Calculation
-            delta = close_prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = rsi.iloc[-1]
-
-            # Bollinger Bands
-            sma = close_prices.rolling(window=20).mean()
-            std = close_prices.rolling(window=20).std()
-            upper_band = sma + (std * 2)
-
-            # Breakout Score
-            breakout_score = 0
-            latest_close = close_prices.iloc[-1]
-            previous_close = close_prices.iloc[-2]
-
-            # Upper Band Breakout (70 pts)
-            if latest_close > upper_band.iloc[-1]:
-                breakout_score += 70
-
-            # Volume Surge (30 pts)
-            avg_volume = volumes.rolling(window=20).mean()
-            volume_ratio = volumes.iloc[-1] / avg_volume.iloc[-1] if avg_volume.iloc[-1] > 0 else 0
-            if volume_ratio > 1.5:
-                breakout_score += 30
-
-            # Price Momentum (40 pts)
-            price_change = (latest_close - previous_close) / previous_close * 100
-            if price_change > 3:
-                breakout_score += 40
-
-            # RSI Bonus (20 pts)
-            if current_rsi > 65:
-                breakout_score += 20
-
-            # Volatility Expansion (20 pts)
-            recent_vol = close_prices.tail(5).std()
-            hist_vol = close_prices.std()
-            if recent_vol > hist_vol * 1.2:
-                breakout_score += 20
-
-            # Skip low scores
-            if breakout_score < 80:
-                return None
-
-            # Generate humanized alert
-            alert = self._humanize_alert(ticker, latest_close, breakout_score, current_rsi, volume_ratio)
+            async with self._yahoo_sem, self._yahoo_limiter:
+                async with session.get(url, params=YAHOO_CHART_PARAMS) as resp:
+                    self._note_rate_headers(resp.headers)
+                    if resp.status == 200:
+                        return self._parse_chart(orjson.loads(await resp.read()))
+                    if resp.status == 429 or resp.status >= 500:
+                        retry_after = resp.headers.get('Retry-After', '')
+                        delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt + random.random()
+                    elif resp.status == 404:
+                        # Unknown or delisted symbol - the only status cached as no-data
+                        return None
+                    else:
+                        # 401 crumb / 403 consent or geo block / 400 - the scanner is
+                        # blocked, not the ticker; raise so it isn't marked dead
+                        raise RuntimeError(f"Yahoo returned HTTP {resp.status}")
+            # Back off outside the semaphore so other tickers can proceed
+            if attempt < YAHOO_MAX_ATTEMPTS - 1:
+                await asyncio.sleep(delay)
+        # Raised rather than None so a throttled ticker isn't cached as no-data
+        raise RuntimeError(f"Yahoo still throttling after {YAHOO_MAX_ATTEMPTS} attempts")
+    
+    def _load_cached_histories(self, day: str) -> Tuple[Dict[str, np.ndarray], Dict[str, List[str]]]:
+        """Cached histories for day -> (histories, miss days of tickers being retried)
+        
+        Tickers skipped as no-data come back as empty arrays.
+        """
+        cached, misses = {}, {}
+        for ticker in self.tickers:
+            days = self.cache.get_json('no_data', ticker, DEAD_TICKER_TTL)
+            if isinstance(days, str):
+                days = [days]  # older single-day markers
+            if days:
+                if len(days) >= DEAD_TICKER_MISSES or days[-1] == day:
+                    cached[ticker] = np.empty((0, 5))
+                    continue
+                misses[ticker] = days
+            ohlcv = self.cache.get_array('history', f"{ticker}_{day}", HISTORY_CACHE_TTL)
+            if ohlcv is not None:
+                cached[ticker] = ohlcv
+        return cached, misses
+    
+    def _store_histories(self, day: str, fetched: Dict[str, Optional[np.ndarray]], misses: Dict[str, List[str]]):
+        # Keys are per day, so expired entries would otherwise pile up on disk
+        self.cache.prune('history', HISTORY_CACHE_TTL)
+        self.cache.prune('no_data', DEAD_TICKER_TTL)
+        for ticker, ohlcv in fetched.items():
+            if ohlcv is None or not len(ohlcv):
+                self.cache.put_json('no_data', ticker, misses.get(ticker, []) + [day])
+            else:
+                self.cache.put_array('history', f"{ticker}_{day}", ohlcv)
+                if ticker in misses:
+                    # Data again - forget the earlier miss
+                    self.cache.delete_json('no_data', ticker)
+    
+    async def fetch_histories(self) -> Dict[str, np.ndarray]:
+        """Fetch OHLCV for all tickers - disk cache first, the rest concurrently over one pooled session"""
+        day = datetime.now().strftime('%Y-%m-%d')
+        # Cache reads/writes are small blocking file I/O - one thread hop each way
+        cached, misses = await asyncio.to_thread(self._load_cached_histories, day)
+        missing = [t for t in self.tickers if t not in cached]
+        
+        fetched: Dict[str, Optional[np.ndarray]] = {}
+        if missing:
+            connector = aiohttp.TCPConnector(limit=YAHOO_CONCURRENCY)
+            async with aiohttp.ClientSession(headers=YAHOO_HEADERS, connector=connector,
+                                             timeout=aiohttp.ClientTimeout(total=30)) as session:
+                results = await asyncio.gather(
+                    *(self._fetch_hist(session, t) for t in missing),
+                    return_exceptions=True
+                )
+            
+            for ticker, ohlcv in zip(missing, results):
+                if isinstance(ohlcv, Exception):
+                    print(f"  ✗ Fetch failed for {ticker}: {ohlcv}")
+                else:
+                    fetched[ticker] = ohlcv
+            await asyncio.to_thread(self._store_histories, day, fetched, misses)
+        
+        histories: Dict[str, np.ndarray] = {}
+        for source in (cached, fetched):
+            for ticker, ohlcv in source.items():
+                if ohlcv is not None and len(ohlcv):
+                    histories[ticker] = ohlcv
+        
+        print(f"✓ History for {len(histories)}/{len(self.tickers)} tickers ({len(cached)} from cache)")
+        return histories
 
+    def compute_indicators(self, histories: List[np.ndarray]) -> np.ndarray:
+        """Indicators for many tickers at once -> (N, len(INDICATORS)) matrix
+        
+        Histories are right-aligned into NaN-padded (N, bars) matrices and handed
+        to the breakout kernel (numba when installed, NumPy otherwise).
+        """
+        bars = max(len(h) for h in histories)
+        closes = np.full((len(histories), bars), np.nan)
+        volumes = np.full((len(histories), bars), np.nan)
+        for i, ohlcv in enumerate(histories):
+            closes[i, bars - len(ohlcv):] = ohlcv[:, CLOSE]
+            volumes[i, bars - len(ohlcv):] = ohlcv[:, VOLUME]
+        return breakout_indicators(closes, volumes)
+    
+    def _score_columns(self, histories: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Columnar scoring pass -> (history indices scored, their scores, indicator matrix)"""
+        # Too little history for the 20-bar indicators
+        rows = np.array([i for i, h in enumerate(histories) if len(h) >= 20], dtype=np.intp)
+        if not len(rows):
+            return rows, np.empty(0, dtype=np.int64), np.empty((0, 9))
+        
+        ind = self.compute_indicators([histories[i] for i in rows])
+        latest_close, upper_band, price_change, rsi, _, _, volume_ratio, recent_vol, hist_vol = ind.T
+        
+        # Upper band breakout / volume surge / momentum / RSI / volatility expansion
+        conditions = np.column_stack([
+            latest_close > upper_band,
+            volume_ratio > 1.5,
+            price_change > 3,
+            rsi > 65,
+            recent_vol > hist_vol * 1.2
+        ])
+        return rows, conditions @ BREAKOUT_WEIGHTS, ind
+    
+    def _make_stock(self, ticker: str, score: int, ind: np.ndarray) -> Optional[BreakoutStock]:
+        """Materialize one indicator row as a BreakoutStock"""
+        latest_close, _, _, rsi, volume, avg_volume, volume_ratio, _, _ = ind
+        try:
             return BreakoutStock(
                 ticker=ticker,
-                close_price=round(latest_close, 2),
-                rsi=round(current_rsi, 1),
-                breakout_score=breakout_score,
-                volume=int(volumes.iloc[-1]),
-                avg_volume=int(avg_volume.iloc[-1]),
-                volume_ratio=round(volume_ratio, 2),
+                close_price=round(float(latest_close), 2),
+                rsi=round(float(rsi), 1),
+                breakout_score=int(score),
+                volume=int(volume),
+                avg_volume=int(avg_volume),
+                volume_ratio=round(float(volume_ratio), 2),
                 setup_type='breakout',
-                humanized_alert=alert
+                humanized_alert=self._humanize_alert(ticker, latest_close, int(score), rsi, volume_ratio)
             )
-            
         except Exception as e:
             print(f"  ✗ Error on {ticker}: {e}")
             return None
+    
+    def score_breakouts(self, tickers: List[str], histories: List[np.ndarray]) -> List[Optional[BreakoutStock]]:
+        """Score many tickers' pre-fetched OHLCV in one vectorized pass"""
+        results: List[Optional[BreakoutStock]] = [None] * len(tickers)
+        rows, scores, ind = self._score_columns(histories)
+        # Skip low scores
+        for k in np.flatnonzero(scores >= 80):
+            results[rows[k]] = self._make_stock(tickers[rows[k]], scores[k], ind[k])
+        return results
+
+    def calculate_breakout_score(self, ticker: str, ohlcv: np.ndarray) -> Optional[BreakoutStock]:
+        """Calculate breakout score using original algorithm on a pre-fetched OHLCV array"""
+        return self.score_breakouts([ticker], [ohlcv])[0]
 
     def _humanize_alert(self, ticker: str, price: float, score: int, rsi: float, volume_ratio: float) -> str:
         """Generate structured alert message"""
@@ -218,33 +409,30 @@ Setup: {reasoning}"""
     async def scan_all(self) -> List[BreakoutStock]:
         """Scan all 500 S&P 500 stocks"""
         print(f"\n🔍 Scanning {len(self.tickers)} stocks...")
-        results = []
+        histories = await self.fetch_histories()
+        fetched = [t for t in self.tickers if t in histories]
         
-        for i, ticker in enumerate(self.tickers):
-            result = self.calculate_breakout_score(ticker)
-            if result:
-                results.append(result)
-                print(f"  ✓ {ticker}: Score {result.breakout_score}")
-            
-            if (i + 1) % 50 == 0:
-                print(f"  Progress: {i+1}/{len(self.tickers)}")
+        # One scoring pass for every ticker, off the event loop (the numba kernel
+        # drops the GIL); results stay columnar until the top 10 are picked
+        rows, scores, ind = await asyncio.to_thread(self._score_columns, [histories[t] for t in fetched])
+        hits = np.flatnonzero(scores >= 80)
+        for k in hits:
+            print(f"  ✓ {fetched[rows[k]]}: Score {scores[k]}")
+        print(f"\n✅ Found {len(hits)} breakouts (score >= 80)")
         
-        # Sort by score descending
-        results.sort(key=lambda x: x.breakout_score, reverse=True)
-        print(f"\n✅ Found {len(results)} breakouts (score >= 80)")
-        return results[:10]  # Top 10
+        # Sort by score descending (stable, so ties keep scan order); top 10
+        top = hits[np.argsort(-scores[hits], kind='stable')][:10]
+        stocks = (self._make_stock(fetched[rows[k]], scores[k], ind[k]) for k in top)
+        return [s for s in stocks if s]
 
     async def send_sms_alert(self, stocks: List[BreakoutStock], user_phone: str) -> bool:
         """Send SMS via Twilio"""
         try:
-            from twilio.rest import Client
-            
-            if not all([self.twilio_sid, self.twilio_token, self.twilio_phone]):
+            client = get_twilio()
+            if client is None or not self.twilio_phone:
                 print("❌ Twilio credentials not configured")
                 return False
             
-            client = Client(self.twilio_sid, self.twilio_token)
-            
             message_body = f"🚨 BREAKOUT ALERTS\n{datetime.now().strftime('%m/%d/%Y %I:%M %p')}\n\n"
             
             for i, stock in enumerate(stocks[:5], 1):
@@ -270,17 +458,18 @@ Setup: {reasoning}"""
     async def store_in_supabase(self, stocks: List[BreakoutStock]) -> bool:
         """Store alerts in Supabase with deduplication"""
         try:
-            from supabase import create_client
-            
-            if not self.supabase_url or not self.supabase_key:
+            supabase = get_supabase()
+            if supabase is None:
                 print("❌ Supabase credentials not configured")
                 return False
             
-            supabase = create_client(self.supabase_url, self.supabase_key)
-            
             # Check for recent alerts (7-day dedup)
             cutoff = (datetime.now() - timedelta(days=7)).isoformat()
-            existing = supabase.table('sent_alerts').select('ticker').gte('sent_at', cutoff).execute()
+            # Only ask about this scan's tickers, so the payload is O(candidates) not O(alerts)
+            existing = (supabase.table('sent_alerts').select('ticker')
+                        .gte('sent_at', cutoff)
+                        .in_('ticker', [s.ticker for s in stocks])
+                        .execute())
             recent_tickers = {r['ticker'] for r in existing.data}
             
             # Filter out duplicates
@@ -290,9 +479,10 @@ Setup: {reasoning}"""
                 print("⚠️ All stocks already alerted within 7 days")
                 return True
             
-            # Store new alerts
-            for stock in fresh_stocks:
-                data = {
+            # Store new alerts - one bulk insert; PostgREST returns the rows with their ids
+            sent_at = datetime.now().isoformat()
+            result = supabase.table('sent_alerts').insert([
+                {
                     'ticker': stock.ticker,
                     'alert_price': stock.close_price,
                     'breakout_score': stock.breakout_score,
@@ -300,21 +490,25 @@ Setup: {reasoning}"""
                     'volume_ratio': stock.volume_ratio,
                     'humanized_message': stock.humanized_alert,
                     'detected_pattern': stock.setup_type,
-                    'sent_at': datetime.now().isoformat()
+                    'sent_at': sent_at
                 }
-                
-                result = supabase.table('sent_alerts').insert(data).execute()
-                
-                if result.data:
-                    alert_id = result.data[0]['id']
-                    # Initialize performance tracking
-                    supabase.table('alert_performance').insert({
-                        'alert_id': alert_id,
+                for stock in fresh_stocks
+            ]).execute()
+            
+            if result.data:
+                # Initialize performance tracking - second bulk insert, matched on ticker
+                alert_ids = {r['ticker']: r['id'] for r in result.data}
+                stored = [s for s in fresh_stocks if s.ticker in alert_ids]
+                supabase.table('alert_performance').insert([
+                    {
+                        'alert_id': alert_ids[stock.ticker],
                         'ticker': stock.ticker,
                         'alert_price': stock.close_price,
                         'status': 'active'
-                    }).execute()
-                    print(f"✅ Stored {stock.ticker} to Supabase")
+                    }
+                    for stock in stored
+                ]).execute()
+                print(f"✅ Stored {', '.join(s.ticker for s in stored)} to Supabase")
             
             return True
             
@@ -325,8 +519,10 @@ Setup: {reasoning}"""
     async def get_users_by_tier(self) -> Dict[str, List[Dict]]:
         """Get users grouped by tier from Supabase"""
         try:
-            from supabase import create_client
-            supabase = create_client(self.supabase_url, self.supabase_key)
+            supabase = get_supabase()
+            if supabase is None:
+                print("❌ Supabase credentials not configured")
+                return {'basic': [], 'pro': [], 'vip': []}
             
             result = supabase.table('users').select('*').eq('status', 'active').eq('sms_enabled', True).execute()
             users = result.data
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Queue-backed logging for the API servers
+Log calls only enqueue records; a listener thread does the stdout I/O
+"""
+
+import sys
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener: QueueListener = None
+
+class _ExtraFormatter(logging.Formatter):
+    """Append structured `extra` fields as key=value pairs"""
+    _RESERVED = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extra = [f"{k}={v}" for k, v in record.__dict__.items() if k not in self._RESERVED]
+        return f"{line} {' '.join(extra)}" if extra else line
+
+def start_logging(level: int = logging.INFO) -> logging.Logger:
+    """Route the root logger through the queue and start the stdout listener"""
+    global _listener
+    if _listener is None:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(_ExtraFormatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        # QueueHandler pre-formats records; keep that to the bare message
+        # and leave the layout to the listener's formatter
+        handler = QueueHandler(_log_queue)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=level, handlers=[handler], force=True)
+        _listener = QueueListener(_log_queue, stream, respect_handler_level=True)
+        _listener.start()
+    return logging.getLogger("breakout")
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
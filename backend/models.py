@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Request/response models shared by the API servers
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class EvaluateRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    ticker: str
+    
+    @field_validator('ticker')
+    @classmethod
+    def normalize_ticker(cls, v: str) -> str:
+        return v.upper()
+
+class BatchRequest(BaseModel):
+    tickers: List[str]
+    
+    @field_validator('tickers')
+    @classmethod
+    def normalize_tickers(cls, v: List[str]) -> List[str]:
+        return [t.strip().upper() for t in v]
+
+class WebhookRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    tickers: str  # Comma-separated
+    source: Optional[str] = "webhook"
+
+class EvaluationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    ticker: str
+    run_score: int
+    verdict: str
+    institutional_score: float
+    narrative_score: float
+    other_score: float
+    reasoning: str
+    upside_projection: str
+    fakeout_risk: str
+    watch_for: List[str]
+    timestamp: str
+    institutional_details: dict
+    narrative_details: dict
+    other_details: dict
+    decision_framework: dict
+    comparables: List[dict]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Batch scoring kernels for the institutional and other-factors pillars
+Same math as InstitutionalAnalyzer / OtherFactorsAnalyzer, over arrays
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:  # optional: pip install numba for the JIT kernels
+    _NUMBA_AVAILABLE = False
+
+# Trend names -> kernel trend ids; anything unlisted maps to TREND_OTHER
+TREND_IDS = {'strong_uptrend': 0, 'uptrend': 1, 'sideways': 2}
+TREND_OTHER = 3
+_TREND_TECH = np.array([100, 80, 60, 40], dtype=np.int64)
+
+def score_institutional_numpy(vol: np.ndarray, oi: np.ndarray, blk: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Score volume-vs-avg %, OI skew % and block counts -> (score, vol_s, oi_s, blk_s)"""
+    vol_s = np.select([vol > 100, vol > 50, vol > 20, vol > 0], [100, 80, 60, 40], default=20)
+    oi_s = np.select([oi > 20, oi > 10, oi > 0], [100, 80, 60], default=40)
+    blk_s = np.select([blk >= 5, blk >= 3, blk >= 1], [100, 80, 60], default=40)
+    score = vol_s * 0.5 + oi_s * 0.35 + blk_s * 0.15
+    return score, vol_s, oi_s, blk_s
+
+def score_other_numpy(trend_id: np.ndarray, warn_len: np.ndarray, is_healthy: np.ndarray,
+                      has_growth: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Score trend ids, warning counts and fundamentals flags -> (score, tech_s, fund_s, risk_s)"""
+    tech_s = np.maximum(20, _TREND_TECH[trend_id] - warn_len * 10)
+    fund_s = np.where(is_healthy, np.where(has_growth, 100, 80), 50)
+    risk_s = np.where(warn_len == 0, 80, np.maximum(40, 80 - warn_len * 20))
+    score = tech_s * 0.45 + fund_s * 0.35 + risk_s * 0.20
+    return score, tech_s, fund_s, risk_s
+
+if _NUMBA_AVAILABLE:
+    # No fastmath: the weighted sums must match the scalar analyzers exactly
+    @numba.njit(cache=True, nogil=True)
+    def score_institutional_jit(vol, oi, blk):
+        """Fused per-ticker loop; same ladders as score_institutional_numpy"""
+        n = vol.shape[0]
+        score = np.empty(n, dtype=np.float64)
+        vol_s = np.empty(n, dtype=np.int64)
+        oi_s = np.empty(n, dtype=np.int64)
+        blk_s = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            v = vol[i]
+            vol_s[i] = 100 if v > 100 else 80 if v > 50 else 60 if v > 20 else 40 if v > 0 else 20
+            o = oi[i]
+            oi_s[i] = 100 if o > 20 else 80 if o > 10 else 60 if o > 0 else 40
+            b = blk[i]
+            blk_s[i] = 100 if b >= 5 else 80 if b >= 3 else 60 if b >= 1 else 40
+            score[i] = vol_s[i] * 0.5 + oi_s[i] * 0.35 + blk_s[i] * 0.15
+        return score, vol_s, oi_s, blk_s
+
+    @numba.njit(cache=True, nogil=True)
+    def score_other_jit(trend_id, warn_len, is_healthy, has_growth):
+        """Fused per-ticker loop; same rules as score_other_numpy"""
+        n = trend_id.shape[0]
+        score = np.empty(n, dtype=np.float64)
+        tech_s = np.empty(n, dtype=np.int64)
+        fund_s = np.empty(n, dtype=np.int64)
+        risk_s = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            w = warn_len[i]
+            tech_s[i] = max(20, _TREND_TECH[trend_id[i]] - w * 10)
+            fund_s[i] = (100 if has_growth[i] else 80) if is_healthy[i] else 50
+            risk_s[i] = 80 if w == 0 else max(40, 80 - w * 20)
+            score[i] = tech_s[i] * 0.45 + fund_s[i] * 0.35 + risk_s[i] * 0.20
+        return score, tech_s, fund_s, risk_s
+
+    score_institutional = score_institutional_jit
+    score_other = score_other_jit
+else:
+    score_institutional = score_institutional_numpy
+    score_other = score_other_numpy
@@ -6,47 +6,34 @@ Handles payment confirmations and user activation
 
 import os
 import sys
-import json
-import hmac
-import hashlib
+import logging
+import orjson
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from supabase import create_client
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from clients import get_supabase, get_twilio
+
+logger = logging.getLogger("breakout.stripe")
+
+# Checkout amount (cents) -> tier, when the session carries no known price ID
+_AMOUNT_TO_TIER = {2900: 'basic', 4900: 'pro', 9900: 'vip'}
+
 class StripeWebhookHandler:
     def __init__(self):
-        self.supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
+        self.supabase = get_supabase()
         self.webhook_secret = os.getenv('STRIPE_WEBHOOK_SECRET', '')
-    
-    def verify_signature(self, payload: bytes, sig_header: str) -> bool:
-        """Verify Stripe webhook signature"""
-        if not self.webhook_secret:
-            return True  # Skip verification in development
-        
-        try:
-            timestamp, signature = sig_header.split(',')
-            timestamp = timestamp.split('=')[1]
-            signature = signature.split('=')[1]
-            
-            signed_payload = f"{timestamp}.{payload.decode('utf-8')}"
-            expected_sig = hmac.new(
-                self.webhook_secret.encode('utf-8'),
-                signed_payload.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-            
-            return hmac.compare_digest(expected_sig, signature)
-        except:
-            return False
+        # Exact Stripe price ID -> tier, from STRIPE_PRICE_ID_{BASIC,PRO,VIP}
+        self.price_to_tier = {
+            price_id: tier
+            for tier in ('basic', 'pro', 'vip')
+            if (price_id := os.getenv(f'STRIPE_PRICE_ID_{tier.upper()}'))
+        }
     
     def handle_checkout_completed(self, session: dict):
         """Handle successful checkout - activate user"""
@@ -70,7 +57,7 @@ class StripeWebhookHandler:
                     user = result.data[0]
             
             if not user:
-                print(f"⚠️ No user found for email: {customer_email}, phone: {customer_phone}")
+                logger.warning("stripe_user_not_found", extra={"email": customer_email, "phone": customer_phone})
                 return {'status': 'error', 'message': 'User not found'}
             
             # Determine tier from line items
@@ -85,7 +72,7 @@ class StripeWebhookHandler:
                 'updated_at': datetime.now().isoformat()
             }).eq('id', user['id']).execute()
             
-            print(f"✅ Activated user: {user.get('name', 'Unknown')} - Tier: {tier}")
+            logger.info("stripe_user_activated", extra={"user_id": user['id'], "tier": tier})
             
             # Send welcome SMS
             self._send_welcome_sms(user, tier)
@@ -93,7 +80,7 @@ class StripeWebhookHandler:
             return {'status': 'success', 'user_id': user['id'], 'tier': tier}
             
         except Exception as e:
-            print(f"❌ Error handling checkout: {e}")
+            logger.exception("stripe_checkout_failed")
             return {'status': 'error', 'message': str(e)}
     
     def _get_tier_from_session(self, session: dict) -> str:
@@ -101,39 +88,22 @@ class StripeWebhookHandler:
         try:
             line_items = session.get('line_items', {}).get('data', [])
             if line_items:
-                price_id = line_items[0].get('price', {}).get('id', '')
-                # Map price IDs to tiers
-                tier_map = {
-                    'price_basic': 'basic',
-                    'price_pro': 'pro',
-                    'price_vip': 'vip',
-                }
-                for key, tier in tier_map.items():
-                    if key in price_id.lower():
-                        return tier
+                tier = self.price_to_tier.get(line_items[0].get('price', {}).get('id', ''))
+                if tier:
+                    return tier
             
             # Fallback: check amount
-            amount = session.get('amount_total', 0)
-            if amount == 2900:  # $29
-                return 'basic'
-            elif amount == 4900:  # $49
-                return 'pro'
-            elif amount == 9900:  # $99
-                return 'vip'
-            
-            return 'basic'  # Default
+            return _AMOUNT_TO_TIER.get(session.get('amount_total', 0), 'basic')
         except:
             return 'basic'
     
     def _send_welcome_sms(self, user: dict, tier: str):
         """Send welcome SMS after payment"""
         try:
-            from twilio.rest import Client
-            
-            twilio = Client(
-                os.getenv('TWILIO_ACCOUNT_SID'),
-                os.getenv('TWILIO_AUTH_TOKEN')
-            )
+            twilio = get_twilio()
+            if twilio is None:
+                logger.warning("welcome_sms_failed", extra={"error": "Twilio not configured"})
+                return
             
             name = user.get('name', 'Trader')
             phone = user.get('phone')
@@ -164,10 +134,10 @@ Let's catch some breakouts! 📈"""
                 to=phone
             )
             
-            print(f"✅ Welcome SMS sent to {name}")
+            logger.info("welcome_sms_sent", extra={"user_id": user.get('id')})
             
         except Exception as e:
-            print(f"⚠️ Could not send welcome SMS: {e}")
+            logger.warning("welcome_sms_failed", extra={"error": str(e)})
     
     def handle_subscription_cancelled(self, subscription: dict):
         """Handle subscription cancellation"""
@@ -178,7 +148,7 @@ Let's catch some breakouts! 📈"""
             result = self.supabase.table('users').select('*').eq('stripe_customer_id', customer_id).execute()
             
             if not result.data:
-                print(f"⚠️ No user found for customer: {customer_id}")
+                logger.warning("stripe_user_not_found", extra={"customer_id": customer_id})
                 return {'status': 'error', 'message': 'User not found'}
             
             user = result.data[0]
@@ -189,24 +159,37 @@ Let's catch some breakouts! 📈"""
                 'updated_at': datetime.now().isoformat()
             }).eq('id', user['id']).execute()
             
-            print(f"✅ Deactivated user: {user.get('name', 'Unknown')}")
+            logger.info("stripe_user_deactivated", extra={"user_id": user['id']})
             return {'status': 'success', 'user_id': user['id']}
             
         except Exception as e:
-            print(f"❌ Error handling cancellation: {e}")
+            logger.exception("stripe_cancellation_failed")
             return {'status': 'error', 'message': str(e)}
     
     def process_webhook(self, payload: bytes, sig_header: str) -> dict:
         """Main webhook processing"""
-        # Verify signature
-        if not self.verify_signature(payload, sig_header):
+        if not self.webhook_secret:
+            logger.error("stripe_webhook_secret_missing")
+            return {'status': 'error', 'message': 'Webhook secret not configured'}
+        
+        # Imported on the first webhook rather than at worker startup
+        import stripe
+        
+        # Verify the raw body first (constant-time, every v1 signature, timestamp
+        # tolerance), then parse it with orjson into a plain dict
+        try:
+            # verify_header only checks the timestamp when given a tolerance -
+            # without one a captured webhook could be replayed forever
+            stripe.WebhookSignature.verify_header(payload.decode('utf-8'), sig_header, self.webhook_secret,
+                                                  tolerance=stripe.Webhook.DEFAULT_TOLERANCE)
+            event = orjson.loads(payload)
+        except (ValueError, stripe.SignatureVerificationError):
             return {'status': 'error', 'message': 'Invalid signature'}
         
         try:
-            event = json.loads(payload)
             event_type = event.get('type', '')
             
-            print(f"📩 Stripe webhook received: {event_type}")
+            logger.info("stripe_webhook", extra={"event_type": event_type})
             
             if event_type == 'checkout.session.completed':
                 return self.handle_checkout_completed(event['data']['object'])
@@ -216,14 +199,14 @@ Let's catch some breakouts! 📈"""
             
             elif event_type == 'invoice.paid':
                 # Handle recurring payment
-                print("✅ Recurring payment received")
+                logger.info("stripe_recurring_payment")
                 return {'status': 'success', 'message': 'Recurring payment noted'}
             
             else:
                 return {'status': 'ignored', 'message': f'Event type: {event_type}'}
                 
         except Exception as e:
-            print(f"❌ Webhook processing error: {e}")
+            logger.exception("stripe_webhook_failed")
             return {'status': 'error', 'message': str(e)}
 
 
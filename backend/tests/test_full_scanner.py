@@ -0,0 +1,95 @@
+import asyncio
+import os
+import sys
+
+import numpy as np
+import orjson
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("aiolimiter")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import full_scanner
+from full_scanner import FullBreakoutScanner
+
+class _Response:
+    def __init__(self, status, body=b''):
+        self.status = status
+        self.headers = {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class _Session:
+    """Answers every chart request for a ticker with one canned response"""
+    def __init__(self, responses):
+        self.responses = responses
+
+    def get(self, url, params=None):
+        return self.responses[url.rsplit('/', 1)[-1]]
+
+class _Async:
+    """Stands in for aiohttp.ClientSession(...) as an async context manager"""
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *exc):
+        return False
+
+@pytest.fixture
+def scanner(monkeypatch, tmp_path):
+    monkeypatch.setenv('SCAN_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(FullBreakoutScanner, '_fetch_sp500_tickers', lambda self: ['GONE', 'EMPTY', 'OK'])
+    return FullBreakoutScanner()
+
+def _chart(closes):
+    n = len(closes)
+    return orjson.dumps({'chart': {'result': [{'indicators': {
+        'quote': [{'open': closes, 'high': closes, 'low': closes, 'close': closes, 'volume': [1e6] * n}]
+    }}]}})
+
+@pytest.mark.parametrize('status', [400, 401, 403])
+def test_blocked_scanner_raises(scanner, status):
+    session = _Session({'OK': _Response(status)})
+    with pytest.raises(RuntimeError):
+        asyncio.run(scanner._fetch_hist(session, 'OK'))
+
+def test_blocked_scanner_marks_nothing_dead(scanner, monkeypatch):
+    session = _Session({t: _Response(401) for t in scanner.tickers})
+    monkeypatch.setattr(full_scanner.aiohttp, 'ClientSession', lambda **kw: _Async(session))
+    assert asyncio.run(scanner.fetch_histories()) == {}
+    assert not os.path.exists(scanner.cache._path('no_data', ''))
+
+def test_missing_symbol_is_a_miss(scanner, monkeypatch):
+    session = _Session({
+        'GONE': _Response(404),
+        'EMPTY': _Response(200, b'{"chart": {"result": null}}'),
+        'OK': _Response(200, _chart([float(i) for i in range(1, 31)])),
+    })
+    monkeypatch.setattr(full_scanner.aiohttp, 'ClientSession', lambda **kw: _Async(session))
+    histories = asyncio.run(scanner.fetch_histories())
+    assert list(histories) == ['OK']
+    assert scanner.cache.get_json('no_data', 'GONE', 60)
+    assert scanner.cache.get_json('no_data', 'EMPTY', 60)
+    assert scanner.cache.get_json('no_data', 'OK', 60) is None
+
+def test_store_prunes_expired_history(scanner):
+    stale = scanner.cache._path('history', 'OK_2000-01-01.npy')
+    os.makedirs(os.path.dirname(stale))
+    open(stale, 'wb').close()
+    os.utime(stale, (0, 0))
+    scanner._store_histories('2026-01-02', {'OK': np.ones((30, 5))}, {})
+    assert not os.path.exists(stale)
+    assert scanner.cache.get_array('history', 'OK_2026-01-02', 60) is not None
@@ -0,0 +1,65 @@
+import asyncio
+import os
+import sys
+
+import orjson
+import pytest
+
+pytest.importorskip("aiohttp")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+pytest.importorskip("data_fetchers.web_search")
+
+from data_fetchers.enhanced_narrative_fetcher import EnhancedNarrativeFetcher
+
+class _Response:
+    def __init__(self, status, body=b''):
+        self.status = status
+        self.headers = {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class _Session:
+    """Answers every X request with the current canned response"""
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def get(self, url, params=None):
+        self.calls += 1
+        return self.response
+
+_TWEETS = orjson.dumps({
+    'data': [{'id': '1', 'author_id': 'a', 'text': '$OK breakout',
+              'public_metrics': {'like_count': 50, 'retweet_count': 10, 'reply_count': 5}}],
+    'includes': {'users': [{'id': 'a', 'public_metrics': {'followers_count': 1000}}]}
+})
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    monkeypatch.setenv('X_BEARER_TOKEN', 'test-token')
+    return EnhancedNarrativeFetcher()
+
+def test_failed_x_search_is_not_cached(fetcher):
+    fetcher.session = _Session(_Response(401))
+    failed = asyncio.run(fetcher.search_x_keyword_semantic('OK'))
+    assert failed['found'] is False and 'error' in failed
+
+    fetcher.session = _Session(_Response(200, _TWEETS))
+    recovered = asyncio.run(fetcher.search_x_keyword_semantic('OK'))
+    assert recovered['found'] is True and 'error' not in recovered
+    assert fetcher.session.calls == 2
+
+def test_successful_x_search_is_cached(fetcher):
+    fetcher.session = _Session(_Response(200, _TWEETS))
+    first = asyncio.run(fetcher.search_x_keyword_semantic('OK'))
+    second = asyncio.run(fetcher.search_x_keyword_semantic('OK'))
+    assert second is first
+    assert fetcher.session.calls == 2  # both queries of the first search only
@@ -0,0 +1,40 @@
+import hmac
+import hashlib
+import os
+import sys
+import time
+
+import pytest
+
+stripe = pytest.importorskip("stripe")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stripe_webhook import StripeWebhookHandler
+
+SECRET = "whsec_test"
+PAYLOAD = b'{"type": "invoice.paid", "data": {"object": {}}}'
+
+def _sign(payload: bytes, timestamp: int) -> str:
+    signed = f"{timestamp}.{payload.decode('utf-8')}".encode('utf-8')
+    sig = hmac.new(SECRET.encode('utf-8'), signed, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={sig}"
+
+@pytest.fixture
+def handler(monkeypatch):
+    monkeypatch.setenv('STRIPE_WEBHOOK_SECRET', SECRET)
+    return StripeWebhookHandler()
+
+def test_fresh_signature_accepted(handler):
+    result = handler.process_webhook(PAYLOAD, _sign(PAYLOAD, int(time.time())))
+    assert result['status'] == 'success'
+
+def test_stale_timestamp_rejected(handler):
+    stale = int(time.time()) - stripe.Webhook.DEFAULT_TOLERANCE - 60
+    result = handler.process_webhook(PAYLOAD, _sign(PAYLOAD, stale))
+    assert result == {'status': 'error', 'message': 'Invalid signature'}
+
+def test_bad_signature_rejected(handler):
+    header = _sign(PAYLOAD, int(time.time())).replace('v1=', 'v1=00')
+    result = handler.process_webhook(PAYLOAD, header)
+    assert result['status'] == 'error'
@@ -2,4 +2,4 @@
 # Start script for Render - ensures proper Python path
 export PYTHONPATH="${PYTHONPATH}:$(dirname $(pwd))"
 cd backend
-python -m uvicorn api_server:app --host 0.0.0.0 --port $PORT
+python -m uvicorn api_server:app --host 0.0.0.0 --port $PORT --workers ${WEB_CONCURRENCY:-2} --loop uvloop --http httptools